@@ -23,53 +23,77 @@ Usage:
     python -m mcp_qa --debug=True
 """
 
+import contextlib
 import datetime
+import functools
 import sys
 import traceback
 
-from mcp.server.fastmcp import FastMCP
-import contextlib
-from mcp_qa.db import init_database
-from mcp_qa.logging.logger import logger
+import fire
 
 # Store server start time
 SERVER_START_TIME = datetime.datetime.now().isoformat()
 
-try:
-    # Import logger and tool registration function
-    logger.info(f"Server starting at {SERVER_START_TIME}")
-    from mcp_qa.tools.register_tools import register_tools
 
-    # Create the MCP server instance
-    mcp = FastMCP(
-        "precommit", settings={"host": "localhost", "port": 8081, "reload": True}
-    )
-    logger.info("MCP server instance created")
-
-    # Register all tools
-    register_tools(mcp)
-    logger.info("All tools registered")
-except ModuleNotFoundError as e:
-    # Handle import errors specifically
-    error_msg = f"Import error: {e}\n{traceback.format_exc()}"
-    try:
-        # Fallback import if the standard import fails
-        logger.error(error_msg)
-    except ImportError:
-        # Fallback to printing to stderr if logger import also fails
-        print(error_msg, file=sys.stderr)
-    sys.exit(1)
-except Exception as e:
-    # Handle other exceptions
-    error_msg = f"Initialization error: {e}\n{traceback.format_exc()}"
+@functools.cache
+def create_server(reload=False):
+    """
+    Create the MCP server instance and register all tools.
+
+    The heavy imports (FastMCP, the tool tree and its transitive
+    dependencies) live here rather than at module top so that CLI
+    dispatch (e.g. ``--help``) stays fast.
+
+    Args:
+        reload (bool): Whether to enable FastMCP auto-reload. Off by
+            default; the file watcher is pure overhead in production and
+            races with the swarm's file-editing tools.
+
+    Returns:
+        FastMCP: The configured server instance.
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    from mcp_qa.logging.logger import logger
+
     try:
-        logger.error(error_msg)
-    except ImportError:
-        print(error_msg, file=sys.stderr)
-    sys.exit(1)
+        logger.info(f"Server starting at {SERVER_START_TIME}")
+        from mcp_qa.tools.register_tools import register_tools
+
+        # Create the MCP server instance
+        mcp = FastMCP(
+            "precommit",
+            settings={"host": "localhost", "port": 8081, "reload": reload},
+        )
+        logger.info("MCP server instance created")
+
+        # Register all tools exactly once; re-registration would mutate
+        # FastMCP's internal tool dict on reloads/subprocess imports.
+        if not getattr(mcp, "_saaga_tools_registered", False):
+            register_tools(mcp)
+            mcp._saaga_tools_registered = True
+            logger.info("All tools registered")
+        return mcp
+    except ModuleNotFoundError as e:
+        # Handle import errors specifically
+        error_msg = f"Import error: {e}\n{traceback.format_exc()}"
+        try:
+            logger.error(error_msg)
+        except ImportError:
+            # Fallback to printing to stderr if logger import also fails
+            print(error_msg, file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        # Handle other exceptions
+        error_msg = f"Initialization error: {e}\n{traceback.format_exc()}"
+        try:
+            logger.error(error_msg)
+        except ImportError:
+            print(error_msg, file=sys.stderr)
+        sys.exit(1)
 
 
-def run_server(transport="stdio", host="localhost", port=8081, debug=True):
+def run_server(transport="stdio", host="localhost", port=8081, debug=True, reload=False):
     """
     Run the SaagaLint MCP server with the specified transport.
 
@@ -82,11 +106,19 @@ def run_server(transport="stdio", host="localhost", port=8081, debug=True):
         host (str): The host to bind to when using SSE transport.
         port (int): The port to bind to when using SSE transport.
         debug (bool): Whether to enable debug mode.
-        reload (bool): Whether to enable auto-reload.
+        reload (bool): Whether to enable auto-reload (opt-in via
+            --reload=True; disabled by default).
 
     Returns:
-        None
+        FastMCP: The server instance (for tests; mcp.run blocks in practice).
     """
+    from mcp_qa.db import init_database
+    from mcp_qa.logging.logger import logger
+
+    init_database()
+
+    mcp = create_server(reload=reload)
+
     # Update settings based on parameters
     mcp.settings.host = host
     mcp.settings.port = port
@@ -105,12 +137,13 @@ def run_server(transport="stdio", host="localhost", port=8081, debug=True):
         logger.exception(f"Server failed to start: {e}")
         raise
 
-
-import traceback
+    return mcp
 
 
 @contextlib.contextmanager
 def log_exceptions(operation_name="operation"):
+    from mcp_qa.logging.logger import logger
+
     try:
         yield
     except ImportError as e:
@@ -125,10 +158,5 @@ def log_exceptions(operation_name="operation"):
 
 if __name__ == "__main__":  # pragma: no cover
     # Use Fire to provide a CLI interface
-    init_database()
-    run_server()
-    logger.info("Starting CLI interface with Fire")
     with log_exceptions("Program Start"):
-        # Initialize the default database
-        init_database()
-        run_server()
+        fire.Fire(run_server)
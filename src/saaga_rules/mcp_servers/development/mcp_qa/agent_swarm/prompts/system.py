@@ -3,10 +3,18 @@ This module contains system prompts for the agent swarm.
 # flake8: noqa: E501
 """
 
+import functools
 import platform
 from pathlib import Path
 
+# These never change within a process; computing them once avoids the
+# platform syscalls on every prompt render.
+_PLATFORM_SYSTEM = platform.system()
+_PLATFORM_RELEASE = platform.release()
+_HOME = str(Path.home())
 
+
+@functools.lru_cache(maxsize=8)
 def get_system_prompt(cwd: str, supports_computer_use: bool = False):
     """
     Generate a system prompt for an AI assistant with file editing capabilities.
@@ -215,8 +223,8 @@ By thoughtfully selecting between write_to_file, append_to_file, and replace_in_
 
 SYSTEM INFORMATION
 
-Operating System: {platform.system()} {platform.release()}
-Home Directory: {str(Path.home())}
+Operating System: {_PLATFORM_SYSTEM} {_PLATFORM_RELEASE}
+Home Directory: {_HOME}
 Current Working Directory: {cwd}
 
 ====
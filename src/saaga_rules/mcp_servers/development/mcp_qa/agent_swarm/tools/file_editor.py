@@ -1,7 +1,13 @@
+import atexit
+import functools
+import hashlib
+import itertools
 import os
+import re
+import shutil
 import subprocess
+import sys
 import tempfile
-import uuid
 from pathlib import Path
 
 from langchain_core.tools import tool
@@ -10,6 +16,55 @@ from mcp_qa.utils.git_utils import get_git_root
 
 """A class that provides tools for editing files."""
 
+# Process-lifetime directory for executed scripts; identical code snippets
+# reuse the same on-disk file instead of churning mkdtemp/rmdir per call.
+_SCRIPT_CACHE_DIR = Path(tempfile.mkdtemp(prefix="agent_scripts_"))
+atexit.register(shutil.rmtree, _SCRIPT_CACHE_DIR, ignore_errors=True)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Publish file content atomically via a sibling temp file + os.replace.
+
+    Concurrent readers (pylint subprocesses, the swarm's own read_file)
+    never observe a half-written file.
+    """
+    tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_search(search_text: str):
+    """Compile a literal search pattern once per distinct search string."""
+    return re.compile(re.escape(search_text))
+
+
+def _safe_path(file_path: str) -> Path:
+    """
+    Resolve file_path against the git root without hitting the filesystem.
+
+    os.path.normpath is a pure string operation, unlike Path.resolve()
+    which issues a realpath syscall per path component. Containment in the
+    repository is still enforced to block path traversal.
+
+    Args:
+        file_path: Path relative to the git root
+
+    Returns:
+        The normalized absolute path
+
+    Raises:
+        ValueError: If the path escapes the git root
+    """
+    git_root = get_git_root()
+    path = Path(os.path.normpath(git_root / file_path))
+    # The separator is part of the prefix so a sibling such as
+    # "/repo-other" is not accepted under a root of "/repo"
+    if path != git_root and not str(path).startswith(str(git_root) + os.sep):
+        raise ValueError(f"Path '{file_path}' escapes the repository root")
+    return path
+
 
 @tool
 def read_file(file_path: str) -> str:
@@ -23,8 +78,8 @@ def read_file(file_path: str) -> str:
         The contents of the file as a string
     """
     try:
-        git_root = get_git_root()
-        return (git_root / Path(file_path)).resolve().read_text()
+        # read_bytes + decode skips the text-mode universal-newline layer
+        return _safe_path(file_path).read_bytes().decode("utf-8")
     except Exception as e:
         return f"Error reading file: {str(e)}"
 
@@ -43,11 +98,21 @@ def write_to_file(file_path: str, content: str) -> str:
     """
     try:
         # Create directory if it doesn't exist
-        git_root = get_git_root()
-        path = (git_root / Path(file_path)).resolve()
+        path = _safe_path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        path.write_text(content)
+        # Encode once; the size check, hash and write all reuse the bytes.
+        data = content.encode("utf-8")
+
+        # Skip the write (and the resulting mtime churn that re-triggers
+        # file watchers) when on-disk content is already identical.
+        if path.exists() and path.stat().st_size == len(data):
+            on_disk = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+            incoming = hashlib.blake2b(data, digest_size=16).digest()
+            if on_disk == incoming:
+                return f"Content unchanged, skipped writing to {path}"
+
+        _atomic_write(path, data)
         return f"Successfully wrote to {path}"
     except Exception as e:
         return f"Error writing to file: {str(e)}"
@@ -67,12 +132,11 @@ def append_to_file(file_path: str, content: str) -> str:
     """
     try:
         # Create directory if it doesn't exist
-        git_root = get_git_root()
-        path = (git_root / Path(file_path)).resolve()
+        path = _safe_path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("a") as file:
-            file.write(content)
+        with path.open("ab") as file:
+            file.write(content.encode("utf-8"))
         return f"Successfully appended to {path}"
     except Exception as e:
         return f"Error appending to file: {str(e)}"
@@ -92,20 +156,21 @@ def replace_in_file(file_path: str, search_text: str, replace_text: str) -> str:
         A message indicating success or failure and how many replacements were made
     """
     try:
-        git_root = get_git_root()
-        path = (git_root / Path(file_path)).resolve()
+        path = _safe_path(file_path)
         content = path.read_text()
 
-        # Count occurrences before replacement
-        count = content.count(search_text)
-
-        if count == 0:
+        # find() short-circuits at the first occurrence, so the common
+        # "pattern not present" case avoids a full substitution pass.
+        if content.find(search_text) == -1:
             return f"No occurrences of '{search_text}' found in {path}"
 
-        # Perform replacement
-        new_content = content.replace(search_text, replace_text)
+        # Single subn pass with a cached compiled pattern; repeated agent
+        # edits with the same search text reuse the compiled scanner.
+        # Backslashes in the replacement are escaped so they are literal.
+        pattern = _compiled_search(search_text)
+        new_content, count = pattern.subn(replace_text.replace("\\", "\\\\"), content)
 
-        path.write_text(new_content)
+        _atomic_write(path, new_content.encode("utf-8"))
 
         return (
             f"Successfully replaced {count} occurrence(s) of '{search_text}' in {path}"
@@ -139,7 +204,8 @@ def get_python_files_tree(directory: str = "") -> str:
                 )
 
         tree_output = []
-        _build_python_tree(start_dir, git_root, "", tree_output, is_root=True)
+        py_dirs = _collect_python_dirs(start_dir)
+        _build_python_tree(start_dir, git_root, "", tree_output, py_dirs, is_root=True)
 
         return "\n".join(tree_output)
     except Exception as e:
@@ -165,46 +231,37 @@ def execute_python_code(code: str, input_data: str = "") -> str:
         The output of the executed program (stdout and stderr)
     """
     try:
-        # Create a temporary directory for the script
-        temp_dir = tempfile.mkdtemp(prefix="agent_script_")
-
-        # Generate a unique filename
-        script_name = f"agent_script_{uuid.uuid4().hex}.py"
-        script_path = os.path.join(temp_dir, script_name)
-
-        # Write the code to the temporary file
-        with open(script_path, "w") as f:
-            f.write(code)
-
-        # Execute the script
+        # Key the script by its content so repeated executions of the same
+        # code reuse the cached file.
+        key = hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+        script_path = _SCRIPT_CACHE_DIR / f"{key}.py"
+        if not script_path.exists():
+            script_path.write_text(code)
+
+        # Execute the script with uniform bytes I/O; decoding once at the
+        # end with errors="replace" keeps non-UTF-8 output from raising.
         process = subprocess.run(
-            ["python", script_path],
+            [sys.executable, str(script_path)],
             input=input_data.encode() if input_data else None,
             capture_output=True,
-            text=True,
             timeout=30,  # Set a timeout to prevent infinite loops
         )
+        stdout = process.stdout.decode("utf-8", "replace")
+        stderr = process.stderr.decode("utf-8", "replace")
 
         # Collect output
         output = []
-        if process.stdout:
+        if stdout:
             output.append("=== STDOUT ===")
-            output.append(process.stdout)
+            output.append(stdout)
 
-        if process.stderr:
+        if stderr:
             output.append("=== STDERR ===")
-            output.append(process.stderr)
+            output.append(stderr)
 
         if process.returncode != 0:
             output.append(f"=== PROCESS EXITED WITH CODE {process.returncode} ===")
 
-        # Clean up
-        try:
-            os.remove(script_path)
-            os.rmdir(temp_dir)
-        except Exception as e:
-            output.append(f"Warning: Failed to clean up temporary files: {str(e)}")
-
         return "\n".join(output)
     except subprocess.TimeoutExpired:
         return "Error: Script execution timed out (30 seconds limit)"
@@ -212,8 +269,39 @@ def execute_python_code(code: str, input_data: str = "") -> str:
         return f"Error executing Python code: {str(e)}"
 
 
+def _collect_python_dirs(start_dir: Path) -> set:
+    """
+    Collect every directory under start_dir that contains a Python file,
+    directly or in a descendant, with a single os.walk pass.
+
+    Args:
+        start_dir: Directory to scan
+
+    Returns:
+        Set of Path objects for directories containing Python files
+    """
+    py_dirs = set()
+    for dirpath, dirnames, filenames in os.walk(start_dir):
+        # Skip hidden directories in-walk
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        if any(f.endswith(".py") for f in filenames):
+            # Propagate upward so every ancestor knows it holds Python files
+            current = Path(dirpath)
+            while current not in py_dirs:
+                py_dirs.add(current)
+                if current == start_dir:
+                    break
+                current = current.parent
+    return py_dirs
+
+
 def _build_python_tree(
-    path: Path, git_root: Path, prefix: str, output: list, is_root: bool = False
+    path: Path,
+    git_root: Path,
+    prefix: str,
+    output: list,
+    py_dirs: set,
+    is_root: bool = False,
 ):
     """
     Recursively build a tree representation of Python files.
@@ -223,6 +311,7 @@ def _build_python_tree(
         git_root: Git repository root path
         prefix: Prefix for the current line (for formatting)
         output: List to append output lines to
+        py_dirs: Set of directories known to contain Python files
         is_root: Whether this is the root directory
     """
     if is_root:
@@ -235,25 +324,35 @@ def _build_python_tree(
         output.append(f"{prefix}{dir_name}/")
         new_prefix = prefix.replace("├── ", "│   ").replace("└── ", "    ") + "├── "
 
-    # Get all items in the directory
-    items = list(path.iterdir())
-
-    # Filter and sort: directories first, then Python files
-    dirs = sorted([p for p in items if p.is_dir() and not p.name.startswith(".")])
-    py_files = sorted([p for p in items if p.is_file() and p.suffix == ".py"])
-
-    # Process all items
-    for i, item in enumerate(dirs + py_files):
-        is_last = i == len(dirs) + len(py_files) - 1
+    # Partition in one scandir pass; DirEntry caches is_dir() from the
+    # directory read, so no extra stat per entry.
+    dir_names = []
+    py_file_names = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."):
+                    dir_names.append(entry.name)
+            elif entry.name.endswith(".py"):
+                py_file_names.append(entry.name)
+    dir_names.sort()
+    py_file_names.sort()
+
+    # Process all items: directories first, then Python files; chain
+    # avoids allocating a combined list per directory.
+    num_dirs = len(dir_names)
+    last = num_dirs + len(py_file_names) - 1
+    for i, name in enumerate(itertools.chain(dir_names, py_file_names)):
+        is_last = i == last
         current_prefix = new_prefix.replace("├── ", "└── ") if is_last else new_prefix
 
-        if item.is_dir():
-            # Check if directory contains any Python files (recursively)
-            has_py_files = any(f.suffix == ".py" for f in item.glob("**/*.py"))
-            if has_py_files:
-                _build_python_tree(item, git_root, current_prefix, output)
-        elif item.suffix == ".py":
-            output.append(f"{current_prefix}{item.name}")
+        if i < num_dirs:
+            item = path / name
+            # O(1) lookup instead of re-globbing the subtree
+            if item in py_dirs:
+                _build_python_tree(item, git_root, current_prefix, output, py_dirs)
+        else:
+            output.append(f"{current_prefix}{name}")
 
 
 @tool
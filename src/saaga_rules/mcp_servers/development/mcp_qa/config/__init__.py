@@ -6,13 +6,14 @@ Configuration package for development servers.
 from pathlib import Path
 from mcp_qa.logging.logger import logger
 
-from .constants import ReportPaths
+from .constants import REPORTS, ReportPaths
 
 
 # Logger is automatically configured when imported
 
 
 __all__ = [
+    "REPORTS",
     "ReportPaths",
     "logger",
 ]
@@ -2,39 +2,91 @@
 Constants for the development server.
 """
 
-from enum import Enum
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
+# Maps every directory visited during a walk to its git root, so later
+# resolves for that directory or any sibling's ancestor short-circuit
+# without touching the filesystem.
+_GIT_ROOT_CACHE: dict = {}
 
-class ReportPaths(Path, Enum):
-    """Enum for report file paths."""
 
-    @staticmethod
-    def _get_git_root():
-        """Find the git root directory by traversing up from the current file."""
-        current_dir = Path(__file__).resolve().parent
-        git_root = None
+def _has_git_dir(directory: str) -> bool:
+    """Check for a .git subdirectory with one scandir pass.
 
-        # Navigate up until we find .git directory
-        check_dir = current_dir
-        while check_dir != check_dir.parent:
-            if (check_dir / ".git").exists():
-                git_root = check_dir
-                break
-            check_dir = check_dir.parent
+    A scandir per level replaces the isdir() stat of the joined path and
+    reuses the DirEntry's cached type information.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == ".git":
+                    return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
+    return False
 
-        if git_root is None:
+
+def _get_git_root(start: str) -> str:
+    """Find the git root directory by walking up from the given directory.
+
+    Works on plain strings via os.path so the walk avoids per-component
+    Path allocations; every directory visited is cached so repeated
+    resolves skip the walk entirely.
+    """
+    visited = []
+    current = start
+    while True:
+        root = _GIT_ROOT_CACHE.get(current)
+        if root is not None:
+            break
+        visited.append(current)
+        if _has_git_dir(current):
+            root = current
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
             error_msg = "Git repository root not found"
             raise FileNotFoundError(error_msg)
+        current = parent
+
+    for directory in visited:
+        _GIT_ROOT_CACHE[directory] = root
+    return root
+
+
+# Get git root once at module import time
+_GIT_ROOT = _get_git_root(os.path.dirname(os.path.abspath(__file__)))
+_REPORTS_DIR = os.path.join(_GIT_ROOT, "reports")
+
+
+@dataclass(frozen=True, slots=True)
+class ReportPaths:
+    """Report file paths as precomputed absolute path strings.
+
+    A frozen, slotted dataclass so attribute access is a C-level slot
+    read rather than an EnumMeta descriptor lookup, and hot consumers
+    (open, os.path checks, subprocess args) skip pathlib parsing
+    entirely. Use :meth:`as_path` for callers that want a Path.
+    """
+
+    PYTEST_RESULTS: str
+    FAILED_TESTS: str
+    COVERAGE: str
+    AUTOFLAKE: str
+    FLAKE8: str
 
-        return git_root
+    def as_path(self, name: str) -> Path:
+        """Build a Path on demand for the named report (e.g. "COVERAGE")."""
+        return Path(getattr(self, name))
 
-    # Get git root once at module import time
-    _GIT_ROOT = _get_git_root()
 
-    # Use full absolute paths from git root
-    PYTEST_RESULTS = _GIT_ROOT / "reports" / "pytest_results.json"
-    FAILED_TESTS = _GIT_ROOT / "reports" / "failed_tests.json"
-    COVERAGE = _GIT_ROOT / "reports" / "coverage.json"
-    AUTOFLAKE = _GIT_ROOT / "reports" / "autoflake.json"
-    FLAKE8 = _GIT_ROOT / "reports" / "flake8.json"
+# Module singleton; all fields are absolute paths under <git root>/reports
+REPORTS = ReportPaths(
+    PYTEST_RESULTS=os.path.join(_REPORTS_DIR, "pytest_results.json"),
+    FAILED_TESTS=os.path.join(_REPORTS_DIR, "failed_tests.json"),
+    COVERAGE=os.path.join(_REPORTS_DIR, "coverage.json"),
+    AUTOFLAKE=os.path.join(_REPORTS_DIR, "autoflake.json"),
+    FLAKE8=os.path.join(_REPORTS_DIR, "flake8.json"),
+)
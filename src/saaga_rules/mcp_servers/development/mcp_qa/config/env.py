@@ -1,33 +1,78 @@
+import functools
+import os
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import ConfigDict
-from pydantic_settings import BaseSettings
-
-
-class LLM(BaseSettings):
+from dotenv import dotenv_values
+from pydantic import ConfigDict, Field
+from pydantic_settings import BaseSettings, EnvSettingsSource
+
+# Parse .env exactly once for every settings class below; the isfile
+# check also avoids blocking should .env be a FIFO.
+_ENV_VALUES = (
+    {k: v for k, v in dotenv_values(".env").items() if v is not None}
+    if os.path.isfile(".env")
+    else {}
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get(cls):
+    """Instantiate a settings class once; reused for every later access."""
+    return cls()
+
+
+class _SharedDotEnvSource(EnvSettingsSource):
+    """Env source backed by the module-level parsed .env dict."""
+
+    def _load_env_vars(self):
+        if self.case_sensitive:
+            return _ENV_VALUES
+        return {k.lower(): v for k, v in _ENV_VALUES.items()}
+
+
+class EnvSettings(BaseSettings):
+    """Base settings class sharing the single cached .env parse."""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        # Swap the per-class dotenv source (one file open + parse per
+        # class) for the shared pre-parsed dict.
+        return (
+            init_settings,
+            env_settings,
+            _SharedDotEnvSource(settings_cls),
+            file_secret_settings,
+        )
+
+
+class LLM(EnvSettings):
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
     GEMINI_API_KEY: Optional[str] = None
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="LLM_",
     )
 
 
-LLM_API_KEYS = LLM()
-
-
-class Paths(BaseSettings):
-    # Base paths
-    BASE_DIR: Path = Path(__file__).parent.parent
+class Paths(EnvSettings):
+    # Base paths; the factory defers pathlib parsing from class
+    # definition (module import) to first instantiation, which the lazy
+    # singleton registry already postpones until PATHS is accessed
+    BASE_DIR: Path = Field(default_factory=lambda: Path(__file__).parent.parent)
 
     # Database paths
-    DB_DIR: Path = Path("src/mcp_qa/db/data")
+    DB_DIR: Path = Field(default_factory=lambda: Path("src/mcp_qa/db/data"))
 
     # Database settings
     AUDIO_FILENAME: Optional[str] = "audio.mp4"
@@ -37,21 +82,16 @@ class Paths(BaseSettings):
     STREAM_FILENAME: Optional[str] = "stream.mp4"
 
     model_config = ConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="allow"
+        case_sensitive=True, extra="allow"
     )
 
 
-PATHS = Paths()
-
-
-class Twitch(BaseSettings):
+class Twitch(EnvSettings):
     STREAM_KEY: Optional[str] = None
     STREAMINFO_CLIENTID: Optional[str] = None
     STREAMINFO_SECRET: Optional[str] = None
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="TWITCH_",
@@ -64,10 +104,7 @@ class Twitch(BaseSettings):
         return None
 
 
-TWITCH = Twitch()
-
-
-class Reddit(BaseSettings):
+class Reddit(EnvSettings):
     CLIENT_ID: str
     CLIENT_SECRET: str
     USERNAME: Optional[str] = None
@@ -75,116 +112,81 @@ class Reddit(BaseSettings):
     USER_AGENT: str = "mcp-reddit-server"
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="REDDIT_",
     )
 
 
-REDDIT = Reddit()
-
-
-class Zoom(BaseSettings):
+class Zoom(EnvSettings):
     CLIENT_ID: str
     CLIENT_CREDENTIALS: str
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="ZOOM_",
     )
 
 
-ZOOM = Zoom()
-
-
-class AssemblyAI(BaseSettings):
+class AssemblyAI(EnvSettings):
     API_KEY: str
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="ASSEMBLYAI_",
     )
 
 
-ASSEMBLYAI = AssemblyAI()
-
-
-class SessionState(BaseSettings):
+class SessionState(EnvSettings):
     CHAT_SESSION_PATH: Path = Path("chat_session.json")
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="SESSION_",
     )
 
 
-SESSION = SessionState()
-
-
-class Bluesky(BaseSettings):
+class Bluesky(EnvSettings):
     USERNAME: str
     PASSWORD: str
     EMAIL: str
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="BLUESKY_",
     )
 
 
-BLUESKY = Bluesky()
-
-
-class Confluence(BaseSettings):
+class Confluence(EnvSettings):
     API_TOKEN: str
     EMAIL: str
     URL: str
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="CONFLUENCE_",
     )
 
 
-CONFLUENCE = Confluence()
-
-
-class Redis(BaseSettings):
+class Redis(EnvSettings):
     URL: str = "redis://localhost:6379/0"
     DB: str = "mcp"
     PASSWORD: str = "redispassword"
     PORT: int = 6379
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="REDIS_",
     )
 
 
-REDIS = Redis()
-
-
-class Celery(BaseSettings):
+class Celery(EnvSettings):
     BROKER_URL: Optional[str] = None  # Defaults to Redis URL if None
     BACKEND_URL: Optional[str] = None  # Defaults to Redis URL if None
     APP_NAME: str = "mcp_scheduler"
@@ -196,8 +198,6 @@ class Celery(BaseSettings):
     ENABLE_UTC: bool = True
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="CELERY_",
@@ -205,18 +205,15 @@ class Celery(BaseSettings):
 
     def get_broker_url(self) -> str:
         """Return broker URL, defaulting to Redis URL if not specified."""
-        return self.BROKER_URL or REDIS.URL
+        return self.BROKER_URL or _get(Redis).URL
 
     def get_backend_url(self) -> str:
         """Return backend URL, defaulting to Redis URL if not specified."""
-        return self.BACKEND_URL or REDIS.URL
-
-
-CELERY = Celery()
+        return self.BACKEND_URL or _get(Redis).URL
 
 
-class Flower(BaseSettings):
-    BROKER_API: str = REDIS.URL
+class Flower(EnvSettings):
+    BROKER_API: str = Field(default_factory=lambda: _get(Redis).URL)
     ADDRESS: str = "0.0.0.0"
     PORT: int = 5555
     URL_PREFIX: str = ""
@@ -225,12 +222,35 @@ class Flower(BaseSettings):
     DB: str = "flower.db"
 
     model_config = ConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=True,
         extra="allow",
         env_prefix="FLOWER_",
     )
 
 
-FLOWER = Flower()
+# Settings singletons are materialized lazily on first attribute access
+# (PEP 562); importing this module no longer reads .env or runs pydantic
+# validation for integrations the caller never touches.
+_registry = {
+    "LLM_API_KEYS": LLM,
+    "PATHS": Paths,
+    "TWITCH": Twitch,
+    "REDDIT": Reddit,
+    "ZOOM": Zoom,
+    "ASSEMBLYAI": AssemblyAI,
+    "SESSION": SessionState,
+    "BLUESKY": Bluesky,
+    "CONFLUENCE": Confluence,
+    "REDIS": Redis,
+    "CELERY": Celery,
+    "FLOWER": Flower,
+}
+
+
+def __getattr__(name):
+    try:
+        return _get(_registry[name])
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
@@ -5,19 +5,35 @@ This module provides utility functions used by the logger and other
 configuration components of the QA package.
 """
 
+import functools
 import json
 import random
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
-# Try to import wonderwords for random noun generation
 try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+@functools.lru_cache(maxsize=8)
+def _noun_pool(word_min_length: int, word_max_length: int) -> Tuple[str, ...]:
+    """Build the filtered noun list once per (min, max) length pair.
+
+    wonderwords re-filters its full wordlist on every word() call; doing
+    the filter once makes each subsequent noun an O(1) random.choice.
+    The import is deferred so module load never pays for the wordlists.
+    """
     from wonderwords import RandomWord
 
-    WONDERWORDS_AVAILABLE = True
-except ImportError:
-    WONDERWORDS_AVAILABLE = False
+    return tuple(
+        RandomWord().filter(
+            include_parts_of_speech=["nouns"],
+            word_min_length=word_min_length,
+            word_max_length=word_max_length,
+        )
+    )
 
 
 def get_random_noun(word_min_length: int = 4, word_max_length: int = 12) -> str:
@@ -31,18 +47,12 @@ def get_random_noun(word_min_length: int = 4, word_max_length: int = 12) -> str:
         str: A random noun.
     """
     try:
-        if WONDERWORDS_AVAILABLE:
-            r = RandomWord()
-            # Get a random noun with length constraints
-            return r.word(
-                include_parts_of_speech=["nouns"],
-                word_min_length=word_min_length,
-                word_max_length=word_max_length,
-            )
-        else:
-            raise ImportError("wonderwords not available")
+        pool = _noun_pool(word_min_length, word_max_length)
+        if pool:
+            return random.choice(pool)
+        raise ValueError("no nouns match the length constraints")
     except Exception:
-        # Simple fallback if wonderwords fails
+        # Simple fallback if wonderwords fails or is not installed
         return f"log_{random.randint(1000, 9999)}"
 
 
@@ -58,7 +68,7 @@ def json_serializer(record: Dict[str, Any]) -> str:
     """
     # Extract the most important fields for JSON serialization
     log_data = {
-        "timestamp": record["time"].strftime("%Y-%m-%d %H:%M:%S.%f"),
+        "timestamp": record["time"],
         "level": record["level"].name,
         "message": record["message"],
         "name": record["name"],
@@ -70,7 +80,14 @@ def json_serializer(record: Dict[str, Any]) -> str:
     if record["exception"]:
         log_data["exception"] = record["exception"].rstrip()
 
-    # Convert to JSON string
+    # Convert to JSON string; orjson serializes the datetime natively,
+    # skipping a strftime pass per record on the logging thread
+    if orjson is not None:
+        return orjson.dumps(
+            log_data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ).decode()
+
+    log_data["timestamp"] = record["time"].strftime("%Y-%m-%d %H:%M:%S.%f")
     return json.dumps(log_data)
 
 
@@ -98,6 +115,8 @@ def get_standardized_log_filename(
         Path: The standardized log file path.
     """
     # Get current date and time
+    from datetime import datetime
+
     now = datetime.now()
 
     # Format with strftime for better maintainability
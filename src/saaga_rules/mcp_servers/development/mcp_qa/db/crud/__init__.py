@@ -26,26 +26,32 @@ from .pytest_files import (
 
 from .pytest_errors import (
     create_pytest_error,
+    create_pytest_errors_bulk,
     get_pytest_error_by_id,
     get_pytest_error_by_node_id,
+    get_pytest_error_detail,
     get_pytest_errors_by_test_file_id,
     delete_pytest_error,
     delete_pytest_errors_by_test_file_id,
     list_pytest_errors,
+    list_pytest_errors_after,
 )
 
 from .pytest_collection_errors import (
     create_collection_error,
+    create_collection_errors_bulk,
     get_collection_error_by_id,
     get_collection_error_by_node_id,
     get_collection_errors_by_test_file_id,
     delete_collection_error,
     delete_collection_errors_by_test_file_id,
+    delete_collection_errors_by_test_file_ids,
     list_collection_errors,
 )
 
 from .coverage_issues import (
     create_coverage_issue,
+    create_coverage_issues_bulk,
     get_coverage_issue_by_id,
     get_coverage_issues_by_file_path,
     get_coverage_issues_by_source_file_id,
@@ -53,15 +59,18 @@ from .coverage_issues import (
     delete_coverage_issue,
     delete_coverage_issues_by_file_path,
     delete_coverage_issues_by_source_file_id,
+    delete_coverage_issues_by_source_file_ids,
     list_coverage_issues,
 )
 
 from .coverage_branches import (
     create_coverage_branch,
+    create_coverage_branches_bulk,
     get_coverage_branch_by_id,
     get_coverage_branches_by_issue_id,
     delete_coverage_branch,
     delete_coverage_branches_by_issue_id,
+    delete_coverage_branches_by_issue_ids,
     list_coverage_branches,
 )
 
@@ -83,22 +92,28 @@ __all__ = [
     "list_pytest_files",
     # Pytest errors
     "create_pytest_error",
+    "create_pytest_errors_bulk",
     "get_pytest_error_by_id",
     "get_pytest_error_by_node_id",
+    "get_pytest_error_detail",
     "get_pytest_errors_by_test_file_id",
     "delete_pytest_error",
     "delete_pytest_errors_by_test_file_id",
     "list_pytest_errors",
+    "list_pytest_errors_after",
     # Pytest collection errors
     "create_collection_error",
+    "create_collection_errors_bulk",
     "get_collection_error_by_id",
     "get_collection_error_by_node_id",
     "get_collection_errors_by_test_file_id",
     "delete_collection_error",
     "delete_collection_errors_by_test_file_id",
+    "delete_collection_errors_by_test_file_ids",
     "list_collection_errors",
     # Coverage issues
     "create_coverage_issue",
+    "create_coverage_issues_bulk",
     "get_coverage_issue_by_id",
     "get_coverage_issues_by_file_path",
     "get_coverage_issues_by_source_file_id",
@@ -106,12 +121,15 @@ __all__ = [
     "delete_coverage_issue",
     "delete_coverage_issues_by_file_path",
     "delete_coverage_issues_by_source_file_id",
+    "delete_coverage_issues_by_source_file_ids",
     "list_coverage_issues",
     # Coverage branches
     "create_coverage_branch",
+    "create_coverage_branches_bulk",
     "get_coverage_branch_by_id",
     "get_coverage_branches_by_issue_id",
     "delete_coverage_branch",
     "delete_coverage_branches_by_issue_id",
+    "delete_coverage_branches_by_issue_ids",
     "list_coverage_branches",
 ]
@@ -5,18 +5,51 @@ This module provides CRUD (Create, Read, Update, Delete) operations
 for the coverage_branches table in the MCP QA database.
 """
 
-import sqlite3
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, Generator, Iterable, List, Optional, Any, Tuple
 
 from src.mcp_qa.db.db_manager import get_cursor, format_datetime
 
 
+# Module-level SQL constants: re-passing the same string object lets
+# sqlite3's per-connection statement cache reuse the compiled plan
+# instead of re-parsing on every call.
+SQL_INSERT_BRANCH = """
+    INSERT INTO coverage_branches
+    (coverage_issue_id, source_line, end_line, condition, branch_type, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+SQL_GET_BRANCH_BY_ID = "SELECT * FROM coverage_branches WHERE id = ?"
+SQL_GET_BRANCHES_BY_ISSUE_ID = (
+    "SELECT * FROM coverage_branches WHERE coverage_issue_id = ?"
+)
+SQL_DELETE_BRANCH_BY_ID = "DELETE FROM coverage_branches WHERE id = ?"
+SQL_DELETE_BRANCHES_BY_ISSUE_ID = (
+    "DELETE FROM coverage_branches WHERE coverage_issue_id = ?"
+)
+SQL_LIST_BRANCHES = """
+    SELECT * FROM coverage_branches
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Batch size for IN (...) deletes; comfortably under SQLite's default
+# 999-variable limit while still amortizing journal flushes
+_IN_CHUNK = 500
+
+
+def _invalidate_branch_caches() -> None:
+    """Clear read-through caches after any write to coverage_branches."""
+    get_coverage_branch_by_id.cache_clear()
+
+
 def create_coverage_branch(
     coverage_issue_id: int,
     source_line: int,
     end_line: int,
     condition: str,
     branch_type: str,
+    current_time: Optional[str] = None,
 ) -> int:
     """
     Create a new coverage branch record.
@@ -27,19 +60,18 @@ def create_coverage_branch(
         end_line: Line number where the branch ends
         condition: Condition text of the branch
         branch_type: Type of branch
+        current_time: Pre-formatted timestamp to reuse across a batch
+            (computed once per call when omitted)
 
     Returns:
         int: ID of the newly created record
     """
-    current_time = format_datetime()
+    if current_time is None:
+        current_time = format_datetime()
 
     with get_cursor() as cursor:
         cursor.execute(
-            """
-            INSERT INTO coverage_branches 
-            (coverage_issue_id, source_line, end_line, condition, branch_type, created_at) 
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+            SQL_INSERT_BRANCH,
             (
                 coverage_issue_id,
                 source_line,
@@ -49,13 +81,54 @@ def create_coverage_branch(
                 current_time,
             ),
         )
-        return cursor.lastrowid
+        row_id = cursor.lastrowid
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-insert state in between
+    _invalidate_branch_caches()
+    return row_id
+
+
+def create_coverage_branches_bulk(
+    branches: List[Tuple[int, int, int, str, str]],
+) -> int:
+    """
+    Create multiple coverage branch records in a single transaction.
+
+    Amortizes the per-row BEGIN/COMMIT and cursor round-trip cost when
+    ingesting thousands of branches from a coverage run.
 
+    Args:
+        branches: List of (coverage_issue_id, source_line, end_line,
+            condition, branch_type) tuples
+
+    Returns:
+        int: Number of records inserted
+    """
+    if not branches:
+        return 0
 
+    current_time = format_datetime()
+    rows = [branch + (current_time,) for branch in branches]
+
+    with get_cursor() as cursor:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(SQL_INSERT_BRANCH, rows)
+        inserted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-insert state in between
+    _invalidate_branch_caches()
+    return inserted
+
+
+@functools.lru_cache(maxsize=4096)
 def get_coverage_branch_by_id(branch_id: int) -> Optional[Dict[str, Any]]:
     """
     Get a coverage branch by its ID.
 
+    Results are memoized (a cache hit is a dict lookup instead of a
+    SQLite round-trip); every write path clears the cache. Callers must
+    not mutate the returned dict.
+
     Args:
         branch_id: ID of the coverage branch
 
@@ -63,7 +136,7 @@ def get_coverage_branch_by_id(branch_id: int) -> Optional[Dict[str, Any]]:
         Dict: Coverage branch data or None if not found
     """
     with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM coverage_branches WHERE id = ?", (branch_id,))
+        cursor.execute(SQL_GET_BRANCH_BY_ID, (branch_id,))
         row = cursor.fetchone()
 
         if row:
@@ -82,12 +155,9 @@ def get_coverage_branches_by_issue_id(coverage_issue_id: int) -> List[Dict[str,
         List[Dict]: List of coverage branch records
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM coverage_branches WHERE coverage_issue_id = ?",
-            (coverage_issue_id,),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(SQL_GET_BRANCHES_BY_ISSUE_ID, (coverage_issue_id,))
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
 
 
 def delete_coverage_branch(branch_id: int) -> bool:
@@ -101,8 +171,12 @@ def delete_coverage_branch(branch_id: int) -> bool:
         bool: True if deletion was successful, False otherwise
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM coverage_branches WHERE id = ?", (branch_id,))
-        return cursor.rowcount > 0
+        cursor.execute(SQL_DELETE_BRANCH_BY_ID, (branch_id,))
+        deleted = cursor.rowcount > 0
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted row in between
+    _invalidate_branch_caches()
+    return deleted
 
 
 def delete_coverage_branches_by_issue_id(coverage_issue_id: int) -> int:
@@ -116,11 +190,69 @@ def delete_coverage_branches_by_issue_id(coverage_issue_id: int) -> int:
         int: Number of records deleted
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "DELETE FROM coverage_branches WHERE coverage_issue_id = ?",
-            (coverage_issue_id,),
-        )
-        return cursor.rowcount
+        cursor.execute(SQL_DELETE_BRANCHES_BY_ISSUE_ID, (coverage_issue_id,))
+        deleted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_branch_caches()
+    return deleted
+
+
+def delete_coverage_branches_by_issue_ids(coverage_issue_ids: Iterable[int]) -> int:
+    """
+    Delete coverage branches for many coverage issues in few round trips.
+
+    One per-issue DELETE pays a journal write each; a chunked
+    ``WHERE coverage_issue_id IN (...)`` shares that cost across up to
+    500 issues per statement.
+
+    Args:
+        coverage_issue_ids: IDs of the coverage issues
+
+    Returns:
+        int: Number of records deleted
+    """
+    ids = list(coverage_issue_ids)
+    if not ids:
+        return 0
+
+    deleted = 0
+    with get_cursor() as cursor:
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                "DELETE FROM coverage_branches "
+                f"WHERE coverage_issue_id IN ({placeholders})",
+                chunk,
+            )
+            deleted += cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_branch_caches()
+    return deleted
+
+
+def list_coverage_branches_iter(
+    limit: int = 100, offset: int = 0
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Stream coverage branches with pagination.
+
+    Unlike list_coverage_branches this yields one dict at a time, so
+    large result sets are never materialized twice in memory.
+
+    Args:
+        limit: Maximum number of records to return
+        offset: Number of records to skip
+
+    Yields:
+        Dict: Coverage branch records
+    """
+    with get_cursor() as cursor:
+        cursor.execute(SQL_LIST_BRANCHES, (limit, offset))
+        for row in cursor:
+            yield dict(row)
 
 
 def list_coverage_branches(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -135,13 +267,6 @@ def list_coverage_branches(limit: int = 100, offset: int = 0) -> List[Dict[str,
         List[Dict]: List of coverage branch records
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT * FROM coverage_branches
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(SQL_LIST_BRANCHES, (limit, offset))
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
@@ -5,17 +5,59 @@ This module provides CRUD (Create, Read, Update, Delete) operations
 for the coverage_issues table in the MCP QA database.
 """
 
-import sqlite3
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 
 from src.mcp_qa.db.db_manager import get_cursor, format_datetime
 
 
+# Module-level SQL constants: re-passing the same string object lets
+# sqlite3's per-connection statement cache reuse the compiled plan
+# instead of re-parsing on every call.
+SQL_INSERT_ISSUE = """
+    INSERT INTO coverage_issues
+    (file_path, line_number, source_file_id, is_excluded, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_GET_ISSUE_BY_ID = "SELECT * FROM coverage_issues WHERE id = ?"
+SQL_GET_ISSUES_BY_FILE_PATH = "SELECT * FROM coverage_issues WHERE file_path = ?"
+SQL_GET_ISSUES_BY_SOURCE_FILE_ID = (
+    "SELECT * FROM coverage_issues WHERE source_file_id = ?"
+)
+SQL_DELETE_ISSUE_BY_ID = "DELETE FROM coverage_issues WHERE id = ?"
+SQL_DELETE_ISSUES_BY_FILE_PATH = "DELETE FROM coverage_issues WHERE file_path = ?"
+SQL_DELETE_ISSUES_BY_SOURCE_FILE_ID = (
+    "DELETE FROM coverage_issues WHERE source_file_id = ?"
+)
+SQL_LIST_ISSUES = """
+    SELECT * FROM coverage_issues
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+# Fixed UPDATE variants for the small combinational space of optional
+# fields; dynamic f-string SQL would defeat the statement cache.
+SQL_UPDATE_ISSUE_EXCLUDED = "UPDATE coverage_issues SET is_excluded = ? WHERE id = ?"
+SQL_UPDATE_ISSUE_SOURCE = "UPDATE coverage_issues SET source_file_id = ? WHERE id = ?"
+SQL_UPDATE_ISSUE_BOTH = (
+    "UPDATE coverage_issues SET is_excluded = ?, source_file_id = ? WHERE id = ?"
+)
+
+# Batch size for IN (...) deletes; comfortably under SQLite's default
+# 999-variable limit while still amortizing journal flushes
+_IN_CHUNK = 500
+
+
+def _invalidate_issue_caches() -> None:
+    """Clear read-through caches after any write to coverage_issues."""
+    get_coverage_issue_by_id.cache_clear()
+
+
 def create_coverage_issue(
     file_path: str,
     line_number: int,
     source_file_id: Optional[int] = None,
     is_excluded: bool = False,
+    current_time: Optional[str] = None,
 ) -> int:
     """
     Create a new coverage issue record.
@@ -25,28 +67,68 @@ def create_coverage_issue(
         line_number: Line number with the coverage issue
         source_file_id: ID of the associated source file (optional)
         is_excluded: Whether this issue is excluded from coverage reports
+        current_time: Pre-formatted timestamp to reuse across a batch
+            (computed once per call when omitted)
 
     Returns:
         int: ID of the newly created record
     """
-    current_time = format_datetime()
+    if current_time is None:
+        current_time = format_datetime()
 
     with get_cursor() as cursor:
         cursor.execute(
-            """
-            INSERT INTO coverage_issues 
-            (file_path, line_number, source_file_id, is_excluded, created_at) 
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            SQL_INSERT_ISSUE,
             (file_path, line_number, source_file_id, is_excluded, current_time),
         )
-        return cursor.lastrowid
+        row_id = cursor.lastrowid
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-insert state in between
+    _invalidate_issue_caches()
+    return row_id
+
+
+def create_coverage_issues_bulk(
+    issues: List[Tuple[str, int, Optional[int], bool]],
+) -> int:
+    """
+    Create multiple coverage issue records in a single transaction.
 
+    Amortizes the per-row BEGIN/COMMIT and cursor round-trip cost when
+    ingesting a whole coverage report at once.
 
+    Args:
+        issues: List of (file_path, line_number, source_file_id,
+            is_excluded) tuples
+
+    Returns:
+        int: Number of records inserted
+    """
+    if not issues:
+        return 0
+
+    current_time = format_datetime()
+    rows = [issue + (current_time,) for issue in issues]
+
+    with get_cursor() as cursor:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(SQL_INSERT_ISSUE, rows)
+        inserted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-insert state in between
+    _invalidate_issue_caches()
+    return inserted
+
+
+@functools.lru_cache(maxsize=4096)
 def get_coverage_issue_by_id(issue_id: int) -> Optional[Dict[str, Any]]:
     """
     Get a coverage issue by its ID.
 
+    Results are memoized (a cache hit is a dict lookup instead of a
+    SQLite round-trip); every write path clears the cache. Callers must
+    not mutate the returned dict.
+
     Args:
         issue_id: ID of the coverage issue
 
@@ -54,7 +136,7 @@ def get_coverage_issue_by_id(issue_id: int) -> Optional[Dict[str, Any]]:
         Dict: Coverage issue data or None if not found
     """
     with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM coverage_issues WHERE id = ?", (issue_id,))
+        cursor.execute(SQL_GET_ISSUE_BY_ID, (issue_id,))
         row = cursor.fetchone()
 
         if row:
@@ -73,11 +155,9 @@ def get_coverage_issues_by_file_path(file_path: str) -> List[Dict[str, Any]]:
         List[Dict]: List of coverage issue records
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM coverage_issues WHERE file_path = ?", (file_path,)
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(SQL_GET_ISSUES_BY_FILE_PATH, (file_path,))
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
 
 
 def get_coverage_issues_by_source_file_id(source_file_id: int) -> List[Dict[str, Any]]:
@@ -91,11 +171,9 @@ def get_coverage_issues_by_source_file_id(source_file_id: int) -> List[Dict[str,
         List[Dict]: List of coverage issue records
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM coverage_issues WHERE source_file_id = ?", (source_file_id,)
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(SQL_GET_ISSUES_BY_SOURCE_FILE_ID, (source_file_id,))
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
 
 
 def update_coverage_issue(
@@ -114,32 +192,26 @@ def update_coverage_issue(
     Returns:
         bool: True if update was successful, False otherwise
     """
-    update_fields = []
-    params = []
-
-    if is_excluded is not None:
-        update_fields.append("is_excluded = ?")
-        params.append(is_excluded)
-
-    if source_file_id is not None:
-        update_fields.append("source_file_id = ?")
-        params.append(source_file_id)
-
-    if not update_fields:
+    # Pick one of the fixed statements so SQLite reuses its compiled plan
+    if is_excluded is not None and source_file_id is not None:
+        sql = SQL_UPDATE_ISSUE_BOTH
+        params = (is_excluded, source_file_id, issue_id)
+    elif is_excluded is not None:
+        sql = SQL_UPDATE_ISSUE_EXCLUDED
+        params = (is_excluded, issue_id)
+    elif source_file_id is not None:
+        sql = SQL_UPDATE_ISSUE_SOURCE
+        params = (source_file_id, issue_id)
+    else:
         return False
 
-    params.append(issue_id)
-
     with get_cursor() as cursor:
-        cursor.execute(
-            f"""
-            UPDATE coverage_issues 
-            SET {', '.join(update_fields)}
-            WHERE id = ?
-            """,
-            tuple(params),
-        )
-        return cursor.rowcount > 0
+        cursor.execute(sql, params)
+        updated = cursor.rowcount > 0
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-update row in between
+    _invalidate_issue_caches()
+    return updated
 
 
 def delete_coverage_issue(issue_id: int) -> bool:
@@ -153,8 +225,12 @@ def delete_coverage_issue(issue_id: int) -> bool:
         bool: True if deletion was successful, False otherwise
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM coverage_issues WHERE id = ?", (issue_id,))
-        return cursor.rowcount > 0
+        cursor.execute(SQL_DELETE_ISSUE_BY_ID, (issue_id,))
+        deleted = cursor.rowcount > 0
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted row in between
+    _invalidate_issue_caches()
+    return deleted
 
 
 def delete_coverage_issues_by_file_path(file_path: str) -> int:
@@ -168,8 +244,12 @@ def delete_coverage_issues_by_file_path(file_path: str) -> int:
         int: Number of records deleted
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM coverage_issues WHERE file_path = ?", (file_path,))
-        return cursor.rowcount
+        cursor.execute(SQL_DELETE_ISSUES_BY_FILE_PATH, (file_path,))
+        deleted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_issue_caches()
+    return deleted
 
 
 def delete_coverage_issues_by_source_file_id(source_file_id: int) -> int:
@@ -183,10 +263,47 @@ def delete_coverage_issues_by_source_file_id(source_file_id: int) -> int:
         int: Number of records deleted
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "DELETE FROM coverage_issues WHERE source_file_id = ?", (source_file_id,)
-        )
-        return cursor.rowcount
+        cursor.execute(SQL_DELETE_ISSUES_BY_SOURCE_FILE_ID, (source_file_id,))
+        deleted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_issue_caches()
+    return deleted
+
+
+def delete_coverage_issues_by_source_file_ids(source_file_ids: Iterable[int]) -> int:
+    """
+    Delete coverage issues for many source files in few round trips.
+
+    One per-file DELETE pays a journal write each; a chunked
+    ``WHERE source_file_id IN (...)`` shares that cost across up to
+    500 files per statement.
+
+    Args:
+        source_file_ids: IDs of the source files
+
+    Returns:
+        int: Number of records deleted
+    """
+    ids = list(source_file_ids)
+    if not ids:
+        return 0
+
+    deleted = 0
+    with get_cursor() as cursor:
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                "DELETE FROM coverage_issues "
+                f"WHERE source_file_id IN ({placeholders})",
+                chunk,
+            )
+            deleted += cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_issue_caches()
+    return deleted
 
 
 def list_coverage_issues(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -201,13 +318,6 @@ def list_coverage_issues(limit: int = 100, offset: int = 0) -> List[Dict[str, An
         List[Dict]: List of coverage issue records
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT * FROM coverage_issues
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(SQL_LIST_ISSUES, (limit, offset))
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
@@ -5,12 +5,52 @@ This module provides CRUD (Create, Read, Update, Delete) operations
 for the pytest_collection_errors table in the MCP QA database.
 """
 
-import sqlite3
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 
 from src.mcp_qa.db.db_manager import get_cursor, format_datetime
 
 
+# Module-level SQL constants: re-passing the same string object lets
+# sqlite3's per-connection statement cache reuse the compiled plan
+# instead of re-parsing on every call.
+SQL_INSERT_COLLECTION_ERROR = """
+    INSERT INTO pytest_collection_errors
+    (node_id, test_file_id, outcome, error_type, result, longrepr, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_GET_COLLECTION_ERROR_BY_ID = (
+    "SELECT * FROM pytest_collection_errors WHERE id = ?"
+)
+SQL_GET_COLLECTION_ERROR_BY_NODE_ID = (
+    "SELECT * FROM pytest_collection_errors WHERE node_id = ?"
+)
+SQL_GET_COLLECTION_ERRORS_BY_TEST_FILE_ID = (
+    "SELECT * FROM pytest_collection_errors WHERE test_file_id = ?"
+)
+SQL_DELETE_COLLECTION_ERROR_BY_ID = (
+    "DELETE FROM pytest_collection_errors WHERE id = ?"
+)
+SQL_DELETE_COLLECTION_ERRORS_BY_TEST_FILE_ID = (
+    "DELETE FROM pytest_collection_errors WHERE test_file_id = ?"
+)
+SQL_LIST_COLLECTION_ERRORS = """
+    SELECT * FROM pytest_collection_errors
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Batch size for IN (...) deletes; comfortably under SQLite's default
+# 999-variable limit while still amortizing journal flushes
+_IN_CHUNK = 500
+
+
+def _invalidate_collection_error_caches() -> None:
+    """Clear read-through caches after any write to pytest_collection_errors."""
+    get_collection_error_by_id.cache_clear()
+    get_collection_error_by_node_id.cache_clear()
+
+
 def create_collection_error(
     node_id: str,
     test_file_id: int,
@@ -18,6 +58,7 @@ def create_collection_error(
     error_type: str,
     result: str = "[]",
     longrepr: str = "",
+    current_time: Optional[str] = None,
 ) -> int:
     """
     Create a new pytest collection error record.
@@ -29,19 +70,18 @@ def create_collection_error(
         error_type: Type of error
         result: JSON array with test result details (optional)
         longrepr: Long representation of the error (optional)
+        current_time: Pre-formatted timestamp to reuse across a batch
+            (computed once per call when omitted)
 
     Returns:
         int: ID of the newly created record
     """
-    current_time = format_datetime()
+    if current_time is None:
+        current_time = format_datetime()
 
     with get_cursor() as cursor:
         cursor.execute(
-            """
-            INSERT INTO pytest_collection_errors 
-            (node_id, test_file_id, outcome, error_type, result, longrepr, created_at) 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+            SQL_INSERT_COLLECTION_ERROR,
             (
                 node_id,
                 test_file_id,
@@ -52,13 +92,54 @@ def create_collection_error(
                 current_time,
             ),
         )
-        return cursor.lastrowid
+        row_id = cursor.lastrowid
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-insert state in between
+    _invalidate_collection_error_caches()
+    return row_id
+
+
+def create_collection_errors_bulk(
+    errors: List[Tuple[str, int, str, str, str, str]],
+) -> int:
+    """
+    Create multiple pytest collection error records in one transaction.
+
+    Amortizes the per-row BEGIN/COMMIT and cursor round-trip cost when
+    ingesting a full collection run.
+
+    Args:
+        errors: List of (node_id, test_file_id, outcome, error_type,
+            result, longrepr) tuples
+
+    Returns:
+        int: Number of records inserted
+    """
+    if not errors:
+        return 0
+
+    current_time = format_datetime()
+    rows = [error + (current_time,) for error in errors]
+
+    with get_cursor() as cursor:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(SQL_INSERT_COLLECTION_ERROR, rows)
+        inserted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-insert state in between
+    _invalidate_collection_error_caches()
+    return inserted
 
 
+@functools.lru_cache(maxsize=4096)
 def get_collection_error_by_id(error_id: int) -> Optional[Dict[str, Any]]:
     """
     Get a pytest collection error by its ID.
 
+    Results are memoized (a cache hit is a dict lookup instead of a
+    SQLite round-trip); every write path clears the cache. Callers must
+    not mutate the returned dict.
+
     Args:
         error_id: ID of the pytest collection error
 
@@ -66,9 +147,7 @@ def get_collection_error_by_id(error_id: int) -> Optional[Dict[str, Any]]:
         Dict: Pytest collection error data or None if not found
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM pytest_collection_errors WHERE id = ?", (error_id,)
-        )
+        cursor.execute(SQL_GET_COLLECTION_ERROR_BY_ID, (error_id,))
         row = cursor.fetchone()
 
         if row:
@@ -76,10 +155,14 @@ def get_collection_error_by_id(error_id: int) -> Optional[Dict[str, Any]]:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def get_collection_error_by_node_id(node_id: str) -> Optional[Dict[str, Any]]:
     """
     Get a pytest collection error by its node ID.
 
+    Results are memoized like get_collection_error_by_id; write paths
+    clear the cache. Callers must not mutate the returned dict.
+
     Args:
         node_id: Node ID of the test
 
@@ -87,9 +170,7 @@ def get_collection_error_by_node_id(node_id: str) -> Optional[Dict[str, Any]]:
         Dict: Pytest collection error data or None if not found
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM pytest_collection_errors WHERE node_id = ?", (node_id,)
-        )
+        cursor.execute(SQL_GET_COLLECTION_ERROR_BY_NODE_ID, (node_id,))
         row = cursor.fetchone()
 
         if row:
@@ -109,11 +190,10 @@ def get_collection_errors_by_test_file_id(test_file_id: int) -> List[Dict[str, A
     """
     with get_cursor() as cursor:
         cursor.execute(
-            "SELECT * FROM pytest_collection_errors WHERE test_file_id = ?",
-            (test_file_id,),
+            SQL_GET_COLLECTION_ERRORS_BY_TEST_FILE_ID, (test_file_id,)
         )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
 
 
 def delete_collection_error(error_id: int) -> bool:
@@ -127,8 +207,12 @@ def delete_collection_error(error_id: int) -> bool:
         bool: True if deletion was successful, False otherwise
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM pytest_collection_errors WHERE id = ?", (error_id,))
-        return cursor.rowcount > 0
+        cursor.execute(SQL_DELETE_COLLECTION_ERROR_BY_ID, (error_id,))
+        deleted = cursor.rowcount > 0
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted row in between
+    _invalidate_collection_error_caches()
+    return deleted
 
 
 def delete_collection_errors_by_test_file_id(test_file_id: int) -> int:
@@ -143,10 +227,48 @@ def delete_collection_errors_by_test_file_id(test_file_id: int) -> int:
     """
     with get_cursor() as cursor:
         cursor.execute(
-            "DELETE FROM pytest_collection_errors WHERE test_file_id = ?",
-            (test_file_id,),
+            SQL_DELETE_COLLECTION_ERRORS_BY_TEST_FILE_ID, (test_file_id,)
         )
-        return cursor.rowcount
+        deleted = cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_collection_error_caches()
+    return deleted
+
+
+def delete_collection_errors_by_test_file_ids(test_file_ids: Iterable[int]) -> int:
+    """
+    Delete collection errors for many test files in few round trips.
+
+    One per-file DELETE pays a journal write each; a chunked
+    ``WHERE test_file_id IN (...)`` shares that cost across up to
+    500 files per statement.
+
+    Args:
+        test_file_ids: IDs of the test files
+
+    Returns:
+        int: Number of records deleted
+    """
+    ids = list(test_file_ids)
+    if not ids:
+        return 0
+
+    deleted = 0
+    with get_cursor() as cursor:
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                "DELETE FROM pytest_collection_errors "
+                f"WHERE test_file_id IN ({placeholders})",
+                chunk,
+            )
+            deleted += cursor.rowcount
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted rows in between
+    _invalidate_collection_error_caches()
+    return deleted
 
 
 def list_collection_errors(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -161,13 +283,6 @@ def list_collection_errors(limit: int = 100, offset: int = 0) -> List[Dict[str,
         List[Dict]: List of pytest collection error records
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT * FROM pytest_collection_errors
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(SQL_LIST_COLLECTION_ERRORS, (limit, offset))
+        # Consume the cursor directly; skips the intermediate rows list
+        return list(map(dict, cursor))
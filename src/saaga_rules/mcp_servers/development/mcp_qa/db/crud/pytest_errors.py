@@ -6,9 +6,64 @@ for the pytest_errors table in the MCP QA database.
 """
 
 import sqlite3
-from typing import Dict, List, Optional, Any
-
-from src.mcp_qa.db.db_manager import get_cursor, format_datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+from src.mcp_qa.db.db_manager import (
+    execute_returning_id,
+    fetchall_dicts,
+    fetchone,
+    format_datetime,
+    get_cursor,
+    json_dumps,
+)
+
+
+# Module-level SQL constants: re-passing the same string object lets
+# sqlite3's per-connection statement cache reuse the compiled plan
+# instead of re-parsing on every call.
+SQL_INSERT_PYTEST_ERROR = """
+    INSERT INTO pytest_errors
+    (node_id, test_file_id, outcome, error_type, result, longrepr, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+# Summary column list: omits result/longrepr so the common lookup and
+# list paths never pull the potentially huge error text through the
+# pager cache; get_pytest_error_detail fetches the full row.
+_SUMMARY_COLUMNS = "id, node_id, test_file_id, outcome, error_type, created_at"
+SQL_GET_PYTEST_ERROR_BY_ID = (
+    f"SELECT {_SUMMARY_COLUMNS} FROM pytest_errors WHERE id = ?"
+)
+SQL_GET_PYTEST_ERROR_DETAIL_BY_ID = (
+    f"SELECT {_SUMMARY_COLUMNS}, result, longrepr FROM pytest_errors WHERE id = ?"
+)
+SQL_GET_PYTEST_ERROR_BY_NODE_ID = (
+    f"SELECT {_SUMMARY_COLUMNS} FROM pytest_errors WHERE node_id = ?"
+)
+SQL_GET_PYTEST_ERRORS_BY_TEST_FILE_ID = (
+    f"SELECT {_SUMMARY_COLUMNS} FROM pytest_errors WHERE test_file_id = ?"
+)
+# RETURNING (SQLite 3.35+) reports what was deleted without a separate
+# changes() round trip and hands back ids for cache maintenance
+SQL_DELETE_PYTEST_ERROR_BY_ID = (
+    "DELETE FROM pytest_errors WHERE id = ? RETURNING id"
+)
+SQL_DELETE_PYTEST_ERRORS_BY_TEST_FILE_ID = (
+    "DELETE FROM pytest_errors WHERE test_file_id = ? RETURNING id"
+)
+SQL_LIST_PYTEST_ERRORS = f"""
+    SELECT {_SUMMARY_COLUMNS} FROM pytest_errors
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+# The cursor is (created_at, id): ingest batches share one formatted
+# created_at, so seeking on the timestamp alone would skip every row
+# tied with the previous page's last one
+SQL_LIST_PYTEST_ERRORS_AFTER = f"""
+    SELECT {_SUMMARY_COLUMNS} FROM pytest_errors
+    WHERE (? IS NULL OR (created_at, id) < (?, ?))
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
 
 
 def create_pytest_error(
@@ -16,8 +71,10 @@ def create_pytest_error(
     test_file_id: int,
     outcome: str,
     error_type: str,
-    result: str = "[]",
+    result: Any = "[]",
     longrepr: str = "",
+    cursor: Optional[sqlite3.Cursor] = None,
+    current_time: Optional[str] = None,
 ) -> int:
     """
     Create a new pytest error record.
@@ -27,35 +84,69 @@ def create_pytest_error(
         test_file_id: ID of the associated test file
         outcome: Test outcome (e.g., "failed", "skipped")
         error_type: Type of error
-        result: JSON array with test result details (optional)
+        result: Test result details; lists/dicts are serialized here
+            with orjson, pre-serialized str/bytes pass through (optional)
         longrepr: Long representation of the error (optional)
+        cursor: Cursor from an enclosing db_manager.transaction(); when
+            given, the caller owns the commit, so a loop of creates
+            shares one fsync
+        current_time: Pre-formatted timestamp to reuse across a batch
+            (computed once per call when omitted)
 
     Returns:
         int: ID of the newly created record
     """
+    if current_time is None:
+        current_time = format_datetime()
+
+    if not isinstance(result, (str, bytes)):
+        result = json_dumps(result)
+
+    params = (
+        node_id,
+        test_file_id,
+        outcome,
+        error_type,
+        result,
+        longrepr,
+        current_time,
+    )
+    if cursor is not None:
+        cursor.execute(SQL_INSERT_PYTEST_ERROR, params)
+        return cursor.lastrowid
+    # Autocommit fast path: skips the get_cursor context-manager frames
+    return execute_returning_id(SQL_INSERT_PYTEST_ERROR, params)
+
+
+def create_pytest_errors_bulk(
+    errors: List[Tuple[str, int, str, str, str, str]],
+) -> int:
+    """
+    Create multiple pytest error records in a single transaction.
+
+    Amortizes the per-row BEGIN/COMMIT and cursor round-trip cost when
+    ingesting a full test run's failures at once.
+
+    Args:
+        errors: List of (node_id, test_file_id, outcome, error_type,
+            result, longrepr) tuples
+
+    Returns:
+        int: Number of records inserted
+    """
+    if not errors:
+        return 0
+
     current_time = format_datetime()
+    rows = [error + (current_time,) for error in errors]
 
     with get_cursor() as cursor:
-        cursor.execute(
-            """
-            INSERT INTO pytest_errors 
-            (node_id, test_file_id, outcome, error_type, result, longrepr, created_at) 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                node_id,
-                test_file_id,
-                outcome,
-                error_type,
-                result,
-                longrepr,
-                current_time,
-            ),
-        )
-        return cursor.lastrowid
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(SQL_INSERT_PYTEST_ERROR, rows)
+        return cursor.rowcount
 
 
-def get_pytest_error_by_id(error_id: int) -> Optional[Dict[str, Any]]:
+def get_pytest_error_by_id(error_id: int) -> Optional[sqlite3.Row]:
     """
     Get a pytest error by its ID.
 
@@ -63,18 +154,30 @@ def get_pytest_error_by_id(error_id: int) -> Optional[Dict[str, Any]]:
         error_id: ID of the pytest error
 
     Returns:
-        Dict: Pytest error data or None if not found
+        sqlite3.Row: Pytest error data or None if not found
     """
-    with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM pytest_errors WHERE id = ?", (error_id,))
-        row = cursor.fetchone()
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_PYTEST_ERROR_BY_ID, (error_id,))
 
-        if row:
-            return dict(row)
-        return None
 
+def get_pytest_error_detail(error_id: int) -> Optional[sqlite3.Row]:
+    """
+    Get a pytest error including its result and longrepr payloads.
 
-def get_pytest_error_by_node_id(node_id: str) -> Optional[Dict[str, Any]]:
+    Use this only when the error text is actually needed; the summary
+    getters keep the large columns out of the pager cache.
+
+    Args:
+        error_id: ID of the pytest error
+
+    Returns:
+        sqlite3.Row: Full pytest error data or None if not found
+    """
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_PYTEST_ERROR_DETAIL_BY_ID, (error_id,))
+
+
+def get_pytest_error_by_node_id(node_id: str) -> Optional[sqlite3.Row]:
     """
     Get a pytest error by its node ID.
 
@@ -82,15 +185,10 @@ def get_pytest_error_by_node_id(node_id: str) -> Optional[Dict[str, Any]]:
         node_id: Node ID of the test
 
     Returns:
-        Dict: Pytest error data or None if not found
+        sqlite3.Row: Pytest error data or None if not found
     """
-    with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM pytest_errors WHERE node_id = ?", (node_id,))
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-        return None
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_PYTEST_ERROR_BY_NODE_ID, (node_id,))
 
 
 def get_pytest_errors_by_test_file_id(test_file_id: int) -> List[Dict[str, Any]]:
@@ -103,12 +201,8 @@ def get_pytest_errors_by_test_file_id(test_file_id: int) -> List[Dict[str, Any]]
     Returns:
         List[Dict]: List of pytest error records
     """
-    with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM pytest_errors WHERE test_file_id = ?", (test_file_id,)
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchall_dicts(SQL_GET_PYTEST_ERRORS_BY_TEST_FILE_ID, (test_file_id,))
 
 
 def delete_pytest_error(error_id: int) -> bool:
@@ -122,8 +216,8 @@ def delete_pytest_error(error_id: int) -> bool:
         bool: True if deletion was successful, False otherwise
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM pytest_errors WHERE id = ?", (error_id,))
-        return cursor.rowcount > 0
+        cursor.execute(SQL_DELETE_PYTEST_ERROR_BY_ID, (error_id,))
+        return cursor.fetchone() is not None
 
 
 def delete_pytest_errors_by_test_file_id(test_file_id: int) -> int:
@@ -137,10 +231,41 @@ def delete_pytest_errors_by_test_file_id(test_file_id: int) -> int:
         int: Number of records deleted
     """
     with get_cursor() as cursor:
-        cursor.execute(
-            "DELETE FROM pytest_errors WHERE test_file_id = ?", (test_file_id,)
-        )
-        return cursor.rowcount
+        cursor.execute(SQL_DELETE_PYTEST_ERRORS_BY_TEST_FILE_ID, (test_file_id,))
+        return len(cursor.fetchall())
+
+
+def list_pytest_errors_after(
+    last_created_at: Optional[str] = None,
+    last_id: Optional[int] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """
+    List pytest errors newest-first using keyset pagination.
+
+    LIMIT/OFFSET pagination scans and discards offset rows per page;
+    seeking on the (created_at, id) cursor makes each page
+    O(log n + limit) regardless of how deep the caller has paged. The
+    id tiebreaker matters because rows written in one ingest batch
+    share a formatted created_at — a timestamp-only cursor would drop
+    the rest of a batch split across a page boundary.
+
+    Args:
+        last_created_at: created_at of the last row from the previous
+            page, or None for the first page
+        last_id: id of the last row from the previous page, or None
+            for the first page
+        limit: Maximum number of records to return
+
+    Returns:
+        List[Dict]: List of pytest error records; pass the last row's
+            created_at and id back in to fetch the next page
+    """
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchall_dicts(
+        SQL_LIST_PYTEST_ERRORS_AFTER,
+        (last_created_at, last_created_at, last_id, limit),
+    )
 
 
 def list_pytest_errors(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -154,14 +279,5 @@ def list_pytest_errors(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]
     Returns:
         List[Dict]: List of pytest error records
     """
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT * FROM pytest_errors
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchall_dicts(SQL_LIST_PYTEST_ERRORS, (limit, offset))
@@ -5,14 +5,86 @@ This module provides CRUD (Create, Read, Update, Delete) operations
 for the pytest_files table in the MCP QA database.
 """
 
+import functools
 import sqlite3
 from typing import Dict, List, Optional, Any
 
-from src.mcp_qa.db.db_manager import get_cursor, format_datetime
+from src.mcp_qa.db.db_manager import (
+    execute_returning_id,
+    fetchall_dicts,
+    fetchone,
+    format_datetime,
+    get_cursor,
+    json_dumps,
+    on_commit,
+)
+
+
+# Module-level SQL constants: re-passing the same string object lets
+# sqlite3's per-connection statement cache reuse the compiled plan
+# instead of re-parsing on every call.
+SQL_INSERT_PYTEST_FILE = """
+    INSERT INTO pytest_files
+    (file_path, source_file_id, pytest_summary, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_PF_COLUMNS = "id, file_path, source_file_id, pytest_summary, created_at, updated_at"
+SQL_GET_PYTEST_FILE_BY_ID = (
+    f"SELECT {_PF_COLUMNS} FROM pytest_files WHERE id = ?"
+)
+SQL_GET_PYTEST_FILE_BY_PATH = (
+    f"SELECT {_PF_COLUMNS} FROM pytest_files WHERE file_path = ?"
+)
+SQL_GET_PYTEST_FILES_BY_SOURCE_ID = (
+    f"SELECT {_PF_COLUMNS} FROM pytest_files WHERE source_file_id = ?"
+)
+# RETURNING (SQLite 3.35+) reports what was deleted without a separate
+# changes() round trip
+SQL_DELETE_PYTEST_FILE_BY_ID = (
+    "DELETE FROM pytest_files WHERE id = ? RETURNING id"
+)
+# Fixed UPDATE variants for the small combinational space of optional
+# fields; dynamic f-string SQL would defeat the statement cache.
+SQL_UPDATE_PYTEST_FILE_SOURCE = (
+    "UPDATE pytest_files SET source_file_id = ?, updated_at = ? WHERE id = ?"
+)
+SQL_UPDATE_PYTEST_FILE_SUMMARY = (
+    "UPDATE pytest_files SET pytest_summary = ?, updated_at = ? WHERE id = ?"
+)
+SQL_UPDATE_PYTEST_FILE_BOTH = (
+    "UPDATE pytest_files SET source_file_id = ?, pytest_summary = ?, "
+    "updated_at = ? WHERE id = ?"
+)
+SQL_UPDATE_PYTEST_FILE_TOUCH = (
+    "UPDATE pytest_files SET updated_at = ? WHERE id = ?"
+)
+# Bitmask -> (statement, parameter packer); the mask packs which optional
+# fields were given, so update dispatch is one dict lookup + one tuple
+# build with no branching per call
+_UPDATE_PYTEST_FILE_VARIANTS = {
+    0b11: (SQL_UPDATE_PYTEST_FILE_BOTH, lambda s, p, t, i: (s, p, t, i)),
+    0b10: (SQL_UPDATE_PYTEST_FILE_SOURCE, lambda s, p, t, i: (s, t, i)),
+    0b01: (SQL_UPDATE_PYTEST_FILE_SUMMARY, lambda s, p, t, i: (p, t, i)),
+    0b00: (SQL_UPDATE_PYTEST_FILE_TOUCH, lambda s, p, t, i: (t, i)),
+}
+SQL_LIST_PYTEST_FILES = f"""
+    SELECT {_PF_COLUMNS} FROM pytest_files
+    ORDER BY updated_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+
+def _invalidate_pytest_file_caches() -> None:
+    """Clear read-through caches after any write to pytest_files."""
+    get_pytest_file_by_path.cache_clear()
 
 
 def create_pytest_file(
-    file_path: str, source_file_id: Optional[int] = None, pytest_summary: str = "{}"
+    file_path: str,
+    source_file_id: Optional[int] = None,
+    pytest_summary: Any = "{}",
+    cursor: Optional[sqlite3.Cursor] = None,
+    current_time: Optional[str] = None,
 ) -> int:
     """
     Create a new pytest file record.
@@ -20,26 +92,38 @@ def create_pytest_file(
     Args:
         file_path: Path to the pytest file
         source_file_id: ID of the associated source file (optional)
-        pytest_summary: JSON summary of pytest results (optional)
+        pytest_summary: Summary of pytest results; dicts are serialized
+            here with orjson, pre-serialized str/bytes pass through
+            (optional)
+        cursor: Cursor from an enclosing db_manager.transaction(); when
+            given, the caller owns the commit, so a loop of creates
+            shares one fsync
+        current_time: Pre-formatted timestamp to reuse across a batch
+            (computed once per call when omitted)
 
     Returns:
         int: ID of the newly created record
     """
-    current_time = format_datetime()
-
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            INSERT INTO pytest_files 
-            (file_path, source_file_id, pytest_summary, created_at, updated_at) 
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (file_path, source_file_id, pytest_summary, current_time, current_time),
-        )
+    if current_time is None:
+        current_time = format_datetime()
+
+    if not isinstance(pytest_summary, (str, bytes)):
+        pytest_summary = json_dumps(pytest_summary)
+
+    params = (file_path, source_file_id, pytest_summary, current_time, current_time)
+    if cursor is not None:
+        cursor.execute(SQL_INSERT_PYTEST_FILE, params)
+        # Clear only once the owning transaction commits; clearing
+        # earlier lets a concurrent reader re-cache the pre-insert miss
+        on_commit(_invalidate_pytest_file_caches)
         return cursor.lastrowid
+    # Autocommit fast path: skips the get_cursor context-manager frames
+    row_id = execute_returning_id(SQL_INSERT_PYTEST_FILE, params)
+    _invalidate_pytest_file_caches()
+    return row_id
 
 
-def get_pytest_file_by_id(file_id: int) -> Optional[Dict[str, Any]]:
+def get_pytest_file_by_id(file_id: int) -> Optional[sqlite3.Row]:
     """
     Get a pytest file by its ID.
 
@@ -47,34 +131,29 @@ def get_pytest_file_by_id(file_id: int) -> Optional[Dict[str, Any]]:
         file_id: ID of the pytest file
 
     Returns:
-        Dict: Pytest file data or None if not found
+        sqlite3.Row: Pytest file data or None if not found
     """
-    with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM pytest_files WHERE id = ?", (file_id,))
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-        return None
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_PYTEST_FILE_BY_ID, (file_id,))
 
 
-def get_pytest_file_by_path(file_path: str) -> Optional[Dict[str, Any]]:
+@functools.lru_cache(maxsize=1024)
+def get_pytest_file_by_path(file_path: str) -> Optional[sqlite3.Row]:
     """
     Get a pytest file by its path.
 
+    Results are memoized (resolving the same path during a test run is a
+    dict lookup instead of a SQLite round-trip); every write path clears
+    the cache.
+
     Args:
         file_path: Path of the pytest file
 
     Returns:
-        Dict: Pytest file data or None if not found
+        sqlite3.Row: Pytest file data or None if not found
     """
-    with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM pytest_files WHERE file_path = ?", (file_path,))
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-        return None
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_PYTEST_FILE_BY_PATH, (file_path,))
 
 
 def get_pytest_files_by_source_id(source_file_id: int) -> List[Dict[str, Any]]:
@@ -87,18 +166,14 @@ def get_pytest_files_by_source_id(source_file_id: int) -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: List of pytest file records
     """
-    with get_cursor() as cursor:
-        cursor.execute(
-            "SELECT * FROM pytest_files WHERE source_file_id = ?", (source_file_id,)
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchall_dicts(SQL_GET_PYTEST_FILES_BY_SOURCE_ID, (source_file_id,))
 
 
 def update_pytest_file(
     file_id: int,
     source_file_id: Optional[int] = None,
-    pytest_summary: Optional[str] = None,
+    pytest_summary: Any = None,
 ) -> bool:
     """
     Update a pytest file record.
@@ -112,31 +187,21 @@ def update_pytest_file(
         bool: True if update was successful, False otherwise
     """
     current_time = format_datetime()
-    update_fields = []
-    params = []
 
-    if source_file_id is not None:
-        update_fields.append("source_file_id = ?")
-        params.append(source_file_id)
+    if pytest_summary is not None and not isinstance(pytest_summary, (str, bytes)):
+        pytest_summary = json_dumps(pytest_summary)
 
-    if pytest_summary is not None:
-        update_fields.append("pytest_summary = ?")
-        params.append(pytest_summary)
-
-    update_fields.append("updated_at = ?")
-    params.append(current_time)
-    params.append(file_id)
+    mask = (source_file_id is not None) << 1 | (pytest_summary is not None)
+    sql, pack = _UPDATE_PYTEST_FILE_VARIANTS[mask]
+    params = pack(source_file_id, pytest_summary, current_time, file_id)
 
     with get_cursor() as cursor:
-        cursor.execute(
-            f"""
-            UPDATE pytest_files 
-            SET {', '.join(update_fields)}
-            WHERE id = ?
-            """,
-            tuple(params),
-        )
-        return cursor.rowcount > 0
+        cursor.execute(sql, params)
+        updated = cursor.rowcount > 0
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-update row in between
+    _invalidate_pytest_file_caches()
+    return updated
 
 
 def delete_pytest_file(file_id: int) -> bool:
@@ -150,8 +215,12 @@ def delete_pytest_file(file_id: int) -> bool:
         bool: True if deletion was successful, False otherwise
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM pytest_files WHERE id = ?", (file_id,))
-        return cursor.rowcount > 0
+        cursor.execute(SQL_DELETE_PYTEST_FILE_BY_ID, (file_id,))
+        deleted = cursor.fetchone() is not None
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted row in between
+    _invalidate_pytest_file_caches()
+    return deleted
 
 
 def list_pytest_files(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -165,14 +234,5 @@ def list_pytest_files(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]
     Returns:
         List[Dict]: List of pytest file records
     """
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT * FROM pytest_files
-            ORDER BY updated_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchall_dicts(SQL_LIST_PYTEST_FILES, (limit, offset))
@@ -5,38 +5,104 @@ This module provides CRUD (Create, Read, Update, Delete) operations
 for the source_files table in the MCP QA database.
 """
 
+import functools
 import sqlite3
 from typing import Dict, List, Optional, Any
 
-from src.mcp_qa.db.db_manager import get_cursor, format_datetime
+from src.mcp_qa.db.db_manager import (
+    execute_returning_id,
+    fetchall_dicts,
+    fetchone,
+    format_datetime,
+    get_cursor,
+    on_commit,
+)
+
+
+# Module-level SQL constants: re-passing the same string object lets
+# sqlite3's per-connection statement cache reuse the compiled plan
+# instead of re-parsing on every call.
+SQL_INSERT_SOURCE_FILE = """
+    INSERT INTO source_files
+    (file_path, file_hash, created_at, updated_at)
+    VALUES (?, ?, ?, ?)
+"""
+_SF_COLUMNS = "id, file_path, file_hash, created_at, updated_at"
+SQL_GET_SOURCE_FILE_BY_ID = (
+    f"SELECT {_SF_COLUMNS} FROM source_files WHERE id = ?"
+)
+SQL_GET_SOURCE_FILE_BY_PATH = (
+    f"SELECT {_SF_COLUMNS} FROM source_files WHERE file_path = ?"
+)
+# RETURNING (SQLite 3.35+) reports what was deleted without a separate
+# changes() round trip
+SQL_DELETE_SOURCE_FILE_BY_ID = (
+    "DELETE FROM source_files WHERE id = ? RETURNING id"
+)
+# Fixed UPDATE variants; dynamic f-string SQL would defeat the
+# statement cache.
+SQL_UPDATE_SOURCE_FILE_HASH = (
+    "UPDATE source_files SET file_hash = ?, updated_at = ? WHERE id = ?"
+)
+SQL_UPDATE_SOURCE_FILE_TOUCH = (
+    "UPDATE source_files SET updated_at = ? WHERE id = ?"
+)
+# Presence flag -> (statement, parameter packer); update dispatch is one
+# dict lookup + one tuple build with no branching per call
+_UPDATE_SOURCE_FILE_VARIANTS = {
+    True: (SQL_UPDATE_SOURCE_FILE_HASH, lambda h, t, i: (h, t, i)),
+    False: (SQL_UPDATE_SOURCE_FILE_TOUCH, lambda h, t, i: (t, i)),
+}
+SQL_LIST_SOURCE_FILES = f"""
+    SELECT {_SF_COLUMNS} FROM source_files
+    ORDER BY updated_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+
+def _invalidate_source_file_caches() -> None:
+    """Clear read-through caches after any write to source_files."""
+    get_source_file_by_path.cache_clear()
 
 
-def create_source_file(file_path: str, file_hash: str = "") -> int:
+def create_source_file(
+    file_path: str,
+    file_hash: str = "",
+    cursor: Optional[sqlite3.Cursor] = None,
+    current_time: Optional[str] = None,
+) -> int:
     """
     Create a new source file record.
 
     Args:
         file_path: Path to the source file
         file_hash: Hash of the file contents (optional)
+        cursor: Cursor from an enclosing db_manager.transaction(); when
+            given, the caller owns the commit, so a loop of creates
+            shares one fsync
+        current_time: Pre-formatted timestamp to reuse across a batch
+            (computed once per call when omitted)
 
     Returns:
         int: ID of the newly created record
     """
-    current_time = format_datetime()
-
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            INSERT INTO source_files 
-            (file_path, file_hash, created_at, updated_at) 
-            VALUES (?, ?, ?, ?)
-            """,
-            (file_path, file_hash, current_time, current_time),
-        )
+    if current_time is None:
+        current_time = format_datetime()
+
+    params = (file_path, file_hash, current_time, current_time)
+    if cursor is not None:
+        cursor.execute(SQL_INSERT_SOURCE_FILE, params)
+        # Clear only once the owning transaction commits; clearing
+        # earlier lets a concurrent reader re-cache the pre-insert miss
+        on_commit(_invalidate_source_file_caches)
         return cursor.lastrowid
+    # Autocommit fast path: skips the get_cursor context-manager frames
+    row_id = execute_returning_id(SQL_INSERT_SOURCE_FILE, params)
+    _invalidate_source_file_caches()
+    return row_id
 
 
-def get_source_file_by_id(file_id: int) -> Optional[Dict[str, Any]]:
+def get_source_file_by_id(file_id: int) -> Optional[sqlite3.Row]:
     """
     Get a source file by its ID.
 
@@ -44,34 +110,29 @@ def get_source_file_by_id(file_id: int) -> Optional[Dict[str, Any]]:
         file_id: ID of the source file
 
     Returns:
-        Dict: Source file data or None if not found
+        sqlite3.Row: Source file data or None if not found
     """
-    with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM source_files WHERE id = ?", (file_id,))
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-        return None
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_SOURCE_FILE_BY_ID, (file_id,))
 
 
-def get_source_file_by_path(file_path: str) -> Optional[Dict[str, Any]]:
+@functools.lru_cache(maxsize=1024)
+def get_source_file_by_path(file_path: str) -> Optional[sqlite3.Row]:
     """
     Get a source file by its path.
 
+    Results are memoized (resolving the same path during a test run is a
+    dict lookup instead of a SQLite round-trip); every write path clears
+    the cache.
+
     Args:
         file_path: Path of the source file
 
     Returns:
-        Dict: Source file data or None if not found
+        sqlite3.Row: Source file data or None if not found
     """
-    with get_cursor() as cursor:
-        cursor.execute("SELECT * FROM source_files WHERE file_path = ?", (file_path,))
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-        return None
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchone(SQL_GET_SOURCE_FILE_BY_PATH, (file_path,))
 
 
 def update_source_file(file_id: int, file_hash: Optional[str] = None) -> bool:
@@ -86,27 +147,17 @@ def update_source_file(file_id: int, file_hash: Optional[str] = None) -> bool:
         bool: True if update was successful, False otherwise
     """
     current_time = format_datetime()
-    update_fields = []
-    params = []
-
-    if file_hash is not None:
-        update_fields.append("file_hash = ?")
-        params.append(file_hash)
 
-    update_fields.append("updated_at = ?")
-    params.append(current_time)
-    params.append(file_id)
+    sql, pack = _UPDATE_SOURCE_FILE_VARIANTS[file_hash is not None]
+    params = pack(file_hash, current_time, file_id)
 
     with get_cursor() as cursor:
-        cursor.execute(
-            f"""
-            UPDATE source_files 
-            SET {', '.join(update_fields)}
-            WHERE id = ?
-            """,
-            tuple(params),
-        )
-        return cursor.rowcount > 0
+        cursor.execute(sql, params)
+        updated = cursor.rowcount > 0
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the pre-update row in between
+    _invalidate_source_file_caches()
+    return updated
 
 
 def delete_source_file(file_id: int) -> bool:
@@ -120,8 +171,12 @@ def delete_source_file(file_id: int) -> bool:
         bool: True if deletion was successful, False otherwise
     """
     with get_cursor() as cursor:
-        cursor.execute("DELETE FROM source_files WHERE id = ?", (file_id,))
-        return cursor.rowcount > 0
+        cursor.execute(SQL_DELETE_SOURCE_FILE_BY_ID, (file_id,))
+        deleted = cursor.fetchone() is not None
+    # Invalidate after get_cursor's commit so readers cannot re-cache
+    # the deleted row in between
+    _invalidate_source_file_caches()
+    return deleted
 
 
 def list_source_files(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -135,14 +190,5 @@ def list_source_files(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]
     Returns:
         List[Dict]: List of source file records
     """
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT * FROM source_files
-            ORDER BY updated_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    # Read-only: Connection.execute skips the cursor context manager
+    return fetchall_dicts(SQL_LIST_SOURCE_FILES, (limit, offset))
@@ -6,16 +6,29 @@ initialization, and schema management for SQLite database access
 using raw sqlite3 instead of SQLModel.
 """
 
+import json
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Generator, Optional, Tuple
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from src.mcp_qa.config.env import PATHS
 from src.mcp_qa.db.schema import execute_schema
 
-# Cache connections to avoid recreating them
-_CONNECTION_CACHE: Dict[str, sqlite3.Connection] = {}
+# Per-thread connection cache: sqlite3 connections are not safe to share
+# across threads, and a thread-local keeps reuse allocation-free
+_tls = threading.local()
+
+# Serializes writers in-process: SQLite permits one writer at a time, and
+# queueing on a lock avoids SQLITE_BUSY retry spins under threaded callers
+_WRITE_LOCK = threading.Lock()
 
 # Use DB_DIR from env config
 DB_DIR = PATHS.DB_DIR
@@ -27,7 +40,10 @@ def get_connection(
     isolation_level: Optional[str] = None,
 ) -> sqlite3.Connection:
     """
-    Get or create a database connection.
+    Get or create a database connection for the calling thread.
+
+    Connections are cached per thread, so repeated calls are a dict
+    lookup rather than a connection open plus PRAGMA replay.
 
     Args:
         name: Name of the database
@@ -37,9 +53,13 @@ def get_connection(
     Returns:
         SQLite connection instance
     """
-    # Check if connection already exists in cache
-    if name in _CONNECTION_CACHE:
-        return _CONNECTION_CACHE[name]
+    cache = getattr(_tls, "connections", None)
+    if cache is None:
+        cache = _tls.connections = {}
+
+    connection = cache.get(name)
+    if connection is not None:
+        return connection
 
     # Create data directory if it doesn't exist
     DB_DIR.mkdir(parents=True, exist_ok=True)
@@ -54,25 +74,82 @@ def get_connection(
         timeout=timeout,
         isolation_level=isolation_level,
         detect_types=sqlite3.PARSE_DECLTYPES,
+        # Large enough to keep every hot CRUD statement's compiled plan;
+        # with the module-level SQL constants this gives the long-lived
+        # statement reuse that lower-level drivers expose as
+        # SQLITE_PREPARE_PERSISTENT
+        cached_statements=256,
     )
 
     # Enable foreign keys
     connection.execute("PRAGMA foreign_keys = ON")
 
-    # For better performance
+    # For better performance: WAL avoids writer/reader blocking, NORMAL
+    # sync drops the per-commit fsync (safe under WAL), and the
+    # temp-store/cache/mmap settings keep hot pages in memory. One-shot
+    # per connection; inherited by every cursor.
     connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    connection.execute("PRAGMA cache_size = -64000")
+    connection.execute("PRAGMA mmap_size = 268435456")
+    connection.execute("PRAGMA wal_autocheckpoint = 1000")
 
     # Configure connection to return rows as dictionaries
     connection.row_factory = sqlite3.Row
 
-    # Cache connection for reuse
-    _CONNECTION_CACHE[name] = connection
+    # Cache connection for reuse on this thread
+    cache[name] = connection
 
     return connection
 
 
-# Initialize the default connection
-qa_connection = get_connection("mcp_qa")
+def get_read_connection(
+    name: str, timeout: float = 10.0, dict_rows: bool = False
+) -> sqlite3.Connection:
+    """
+    Get or create a read-only database connection for the calling thread.
+
+    Opened with a mode=ro URI, so readers can never take the write lock
+    and run concurrently with the single writer under WAL.
+
+    Args:
+        name: Name of the database
+        timeout: Timeout for waiting for the database lock (seconds)
+        dict_rows: Install the column-caching dict row factory instead
+            of sqlite3.Row, for the dict-returning list helpers
+
+    Returns:
+        Read-only SQLite connection instance
+    """
+    cache = getattr(_tls, "read_connections", None)
+    if cache is None:
+        cache = _tls.read_connections = {}
+
+    key = f"{name}/dict" if dict_rows else name
+    connection = cache.get(key)
+    if connection is not None:
+        return connection
+
+    db_path = DB_DIR / f"{name}.sqlite"
+    if not db_path.exists():
+        # A mode=ro URI cannot create the file; let the writer path
+        # materialize it first so early reads fail with the usual
+        # "no such table" instead of an open error
+        get_connection(name)
+
+    connection = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        timeout=timeout,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        cached_statements=256,
+    )
+    connection.execute("PRAGMA mmap_size = 268435456")
+    connection.row_factory = make_dict_factory() if dict_rows else sqlite3.Row
+
+    cache[key] = connection
+    return connection
 
 
 def init_db() -> None:
@@ -85,7 +162,7 @@ def init_db() -> None:
     DB_DIR.mkdir(parents=True, exist_ok=True)
 
     # Execute the schema SQL statements
-    execute_schema(qa_connection)
+    execute_schema(get_connection("mcp_qa"))
 
 
 @contextmanager
@@ -93,7 +170,8 @@ def get_cursor() -> Generator[sqlite3.Cursor, None, None]:
     """
     Provide a transactional scope around a series of operations.
 
-    Creates a cursor, handles commit/rollback, and ensures proper cleanup.
+    Creates a cursor on this thread's connection, handles
+    commit/rollback, and ensures proper cleanup.
 
     Yields:
         Cursor: SQLite cursor
@@ -103,7 +181,7 @@ def get_cursor() -> Generator[sqlite3.Cursor, None, None]:
             cursor.execute("SELECT * FROM source_files")
             rows = cursor.fetchall()
     """
-    conn = qa_connection
+    conn = get_connection("mcp_qa")
     cursor = conn.cursor()
     try:
         yield cursor
@@ -115,30 +193,295 @@ def get_cursor() -> Generator[sqlite3.Cursor, None, None]:
         cursor.close()
 
 
-def dict_factory(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, Any]:
+@contextmanager
+def transaction(name: str = "mcp_qa") -> Generator[sqlite3.Cursor, None, None]:
+    """
+    Run a batch of operations inside one explicit transaction.
+
+    Issues BEGIN IMMEDIATE up front so an ingest loop of N writes shares
+    a single journal flush at COMMIT instead of one per statement.
+
+    Args:
+        name: Name of the database
+
+    Yields:
+        Cursor: SQLite cursor
+
+    Example:
+        with transaction() as cursor:
+            for row in rows:
+                cursor.execute(SQL_INSERT, row)
+    """
+    conn = get_connection(name)
+    with _WRITE_LOCK:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        pending: list = []
+        _tls.post_commit = pending
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            _tls.post_commit = None
+            cursor.close()
+    # Deferred callbacks (see on_commit) run only after a successful
+    # commit, outside the write lock
+    for callback in pending:
+        callback()
+
+
+@contextmanager
+def read_cursor(name: str = "mcp_qa") -> Generator[sqlite3.Cursor, None, None]:
+    """
+    Provide a cursor on this thread's read-only connection.
+
+    Multi-statement read paths get WAL's one-writer/N-readers
+    concurrency: the mode=ro connection can never take the write lock,
+    and no commit/rollback frames are needed on cleanup.
+
+    Args:
+        name: Name of the database
+
+    Yields:
+        Cursor: SQLite cursor
+
+    Example:
+        with read_cursor() as cursor:
+            cursor.execute("SELECT * FROM source_files")
+            rows = cursor.fetchall()
+    """
+    cursor = get_read_connection(name).cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def on_commit(callback: Callable[[], None]) -> None:
+    """
+    Run a callback after the enclosing transaction commits.
+
+    Outside a transaction the callback runs immediately. Write helpers
+    use this to defer cache invalidation until their rows are actually
+    visible; clearing before the commit would let a concurrent reader
+    re-populate the cache with the pre-write state.
+
+    Args:
+        callback: Zero-argument callable to run post-commit
+    """
+    pending = getattr(_tls, "post_commit", None)
+    if pending is None:
+        callback()
+    else:
+        pending.append(callback)
+
+
+def __getattr__(name: str) -> Any:
+    # Kept for callers importing the old module-level singleton; resolves
+    # to the calling thread's connection instead of a shared one
+    if name == "qa_connection":
+        return get_connection("mcp_qa")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def execute_returning_id(sql: str, params: Tuple) -> int:
+    """
+    Run a single INSERT and return its lastrowid.
+
+    Connection.execute creates the cursor implicitly and the connection
+    is in autocommit mode, so a one-row insert skips the get_cursor
+    context manager's try/except/commit frames entirely.
+
+    Args:
+        sql: INSERT statement
+        params: Statement parameters
+
+    Returns:
+        int: ID of the newly inserted row
     """
-    Convert a sqlite3.Row to a dictionary.
+    cursor = get_connection("mcp_qa").execute(sql, params)
+    row_id = cursor.lastrowid
+    cursor.close()
+    return row_id
+
+
+def fetchone(sql: str, params: Tuple = ()) -> Optional[sqlite3.Row]:
+    """
+    Run a single read-only statement and return the first row.
+
+    Reads need no commit/rollback, so this skips the get_cursor
+    context-manager frames entirely via Connection.execute, and runs on
+    the read-only connection so it never queues behind the writer.
 
     Args:
-        cursor: SQLite cursor
-        row: Database row
+        sql: SELECT statement
+        params: Statement parameters
 
     Returns:
-        Dict: Dictionary representation of the row
+        sqlite3.Row: First result row or None
     """
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+    return get_read_connection("mcp_qa").execute(sql, params).fetchone()
+
+
+def fetchall_dicts(sql: str, params: Tuple = ()) -> list:
+    """
+    Run a single read-only statement and return all rows as dicts.
+
+    Like fetchone, bypasses the get_cursor context manager for the
+    no-mutation list paths and runs on the dict-rows read connection,
+    whose column-caching row factory builds the dicts during the fetch.
+
+    Args:
+        sql: SELECT statement
+        params: Statement parameters
+
+    Returns:
+        List[Dict]: Dictionary representations of the result rows
+    """
+    cursor = get_read_connection("mcp_qa", dict_rows=True).execute(sql, params)
+    return cursor.fetchall()
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize a Python object to JSON bytes with orjson when available.
+
+    Returning bytes lets callers store the value in a BLOB column with
+    no UTF-8 validation pass on write.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Deserialize JSON from str or bytes with orjson when available.
+
+    The BLOB columns written by json_dumps come back as bytes; orjson
+    decodes them directly, skipping the str round-trip the stdlib
+    decoder would need.
+
+    Args:
+        data: JSON payload as str or bytes
+
+    Returns:
+        Any: Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode()
+    return json.loads(data)
+
+
+def row_to_json_bytes(row: sqlite3.Row) -> bytes:
+    """
+    Serialize a Row straight to JSON bytes.
+
+    For serialization paths this skips the caller-side dict build plus
+    str round-trip; orjson's C encoder handles the rest.
+
+    Args:
+        row: Row to serialize
+
+    Returns:
+        bytes: UTF-8 encoded JSON object
+    """
+    data = dict(zip(row.keys(), row))
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def make_dict_factory():
+    """
+    Build a row_factory that returns dicts directly.
+
+    The last-seen cursor.description is retained in the closure and
+    compared by identity, so every row after the first of a result set
+    is a plain zip into a dict with no description walk. Holding the
+    reference is what makes the identity check sound — a freed tuple's
+    address can be reused by the next query's description. Installed on
+    the dict-rows read connection behind fetchall_dicts; the default
+    connections keep sqlite3.Row for the lazy single-row lookups.
+
+    Returns:
+        Callable: row_factory suitable for sqlite3.Connection.row_factory
+    """
+    last_description: Optional[Tuple] = None
+    columns: Tuple[str, ...] = ()
+
+    def factory(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, Any]:
+        nonlocal last_description, columns
+        description = cursor.description
+        if description is not last_description:
+            columns = tuple(col[0] for col in description)
+            last_description = description
+        return dict(zip(columns, row))
+
+    return factory
+
+
+# (epoch second, formatted string) for the current second; avoids a
+# datetime allocation + isoformat per row in tight insert loops
+_FORMAT_CACHE: Tuple[int, str] = (0, "")
+
+
+def _fast_iso(now: float) -> str:
+    """Format an epoch timestamp as an ISO-8601 string without datetime.
+
+    time.gmtime plus %-formatting skips the datetime object allocation
+    and strftime's per-call format-spec walk. Second resolution only:
+    the result is cached per second, so emitting microseconds would
+    freeze the first call's fraction into every later call that second.
+    """
+    tm = time.gmtime(now)
+    return "%04d-%02d-%02dT%02d:%02d:%02d" % (
+        tm.tm_year,
+        tm.tm_mon,
+        tm.tm_mday,
+        tm.tm_hour,
+        tm.tm_min,
+        tm.tm_sec,
+    )
 
 
 def format_datetime(dt: Optional[datetime] = None) -> str:
     """
     Format a datetime for storage in SQLite.
 
+    The current-time result is cached per wall-clock second, so rapid
+    calls within the same ingest loop share one formatted string. The
+    string carries second resolution to match — sub-second digits would
+    be the first caller's, not the current instant's.
+
     Args:
         dt: Datetime to format, defaults to current UTC time
 
     Returns:
         str: Formatted datetime string
     """
-    if dt is None:
-        dt = datetime.utcnow()
-    return dt.isoformat()
+    global _FORMAT_CACHE
+
+    if dt is not None:
+        return dt.isoformat()
+
+    now = time.time()
+    second = int(now)
+    cached_second, formatted = _FORMAT_CACHE
+    if second == cached_second and formatted:
+        return formatted
+
+    formatted = _fast_iso(now)
+    _FORMAT_CACHE = (second, formatted)
+    return formatted
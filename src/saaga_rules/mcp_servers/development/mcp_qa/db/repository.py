@@ -7,14 +7,22 @@ interactions. It abstracts database operations away from the service
 layer to maintain a clean separation of concerns.
 """
 
-import json
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Union, Any
 
 from loguru import logger
 
-from .db_manager import format_datetime, get_cursor, qa_connection
+from .crud.pytest_files import _invalidate_pytest_file_caches
+from .crud.source_files import _invalidate_source_file_caches
+from .db_manager import (
+    format_datetime,
+    get_cursor,
+    json_dumps,
+    json_loads,
+    read_cursor,
+    transaction,
+)
 
 # Create a logger for the repository module
 repo_logger = logger.bind(component="db_repository")
@@ -29,6 +37,128 @@ CoverageBranchDict = Dict[str, Any]
 # Constants for error types
 ERROR_TYPE_TEST = "PyTestError"
 
+# Module-level SQL constants: the connection's statement cache is keyed
+# by SQL text, so passing the same string object on every call reuses
+# the compiled plan instead of re-parsing the statement each time.
+# Native upserts: ON CONFLICT on the UNIQUE file_path does the lookup,
+# the insert-or-update, and (via RETURNING) the id read in a single
+# statement where the old code ran a SELECT plus an INSERT or UPDATE.
+_SQL_UPSERT_PYTEST_FILE = """
+    INSERT INTO pytest_files
+    (file_path, pytest_summary, created_at, updated_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        pytest_summary = excluded.pytest_summary,
+        updated_at = excluded.updated_at
+    RETURNING id
+"""
+_SQL_UPSERT_TEST_FILE = """
+    INSERT INTO pytest_files
+    (file_path, source_file_id, pytest_summary, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        source_file_id = COALESCE(excluded.source_file_id, source_file_id),
+        updated_at = excluded.updated_at
+    RETURNING id
+"""
+_SQL_UPSERT_SOURCE_FILE = """
+    INSERT INTO source_files
+    (file_path, file_hash, created_at, updated_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        updated_at = excluded.updated_at
+    RETURNING id
+"""
+_SQL_INSERT_PYTEST_ERROR = """
+    INSERT INTO pytest_errors
+    (node_id, test_file_id, outcome, error_type, result, longrepr, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_COVERAGE_ISSUE = """
+    INSERT INTO coverage_issues
+    (file_path, source_file_id, line_number, is_excluded, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_COVERAGE_BRANCH = """
+    INSERT INTO coverage_branches
+    (coverage_issue_id, source_line, end_line, condition, branch_type, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_ERRORS_BY_TEST_FILE_ID = (
+    "DELETE FROM pytest_errors WHERE test_file_id = ?"
+)
+# Chunk size for IN (...) batch deletes, comfortably under SQLite's
+# default 999 bound-variable limit
+_IN_CHUNK = 500
+_SQL_DELETE_ISSUES_BY_FILE_PATH = "DELETE FROM coverage_issues WHERE file_path = ?"
+# Recovers the ids of a just-inserted batch: sqlite3's executemany does
+# not support RETURNING, but within the save transaction the newest N
+# rows for the file are exactly the batch that was inserted
+_SQL_GET_LAST_ISSUE_IDS = """
+    SELECT id FROM coverage_issues
+    WHERE source_file_id = ?
+    ORDER BY id DESC LIMIT ?
+"""
+_SQL_GET_PYTEST_FILE_BY_PATH = """
+    SELECT
+        pf.id, pf.file_path, pf.source_file_id, pf.pytest_summary,
+        pf.created_at, pf.updated_at
+    FROM pytest_files pf
+    WHERE pf.file_path = ?
+"""
+_SQL_GET_ERRORS_BY_TEST_FILE_ID = (
+    "SELECT * FROM pytest_errors WHERE test_file_id = ?"
+)
+_SQL_GET_SOURCE_FILE_BY_PATH = """
+    SELECT
+        sf.id, sf.file_path, sf.file_hash, sf.created_at, sf.updated_at
+    FROM source_files sf
+    WHERE sf.file_path = ?
+"""
+# One LEFT JOIN instead of one branches query per issue: a file with K
+# issues costs a single statement rather than K+1 round trips
+_SQL_GET_ISSUES_WITH_BRANCHES = """
+    SELECT
+        ci.id, ci.file_path, ci.source_file_id, ci.line_number,
+        ci.is_excluded, ci.created_at,
+        cb.id AS branch_id, cb.source_line, cb.end_line,
+        cb.condition, cb.branch_type, cb.created_at AS branch_created_at
+    FROM coverage_issues ci
+    LEFT JOIN coverage_branches cb ON cb.coverage_issue_id = ci.id
+    WHERE ci.source_file_id = ?
+    ORDER BY ci.id
+"""
+_SQL_NEXT_ERROR_FOR_TEST_FILE = """
+    SELECT * FROM pytest_errors
+    WHERE test_file_id = ?
+    ORDER BY id LIMIT 1
+"""
+# Optional filters fold into one statement shape: binding NULL skips
+# the filter, so the statement cache holds exactly one entry per query
+# no matter how callers alternate between filtered and unfiltered calls
+_SQL_NEXT_ERROR = """
+    SELECT * FROM pytest_errors
+    WHERE (? IS NULL OR test_file_id = ?)
+    ORDER BY id LIMIT 1
+"""
+# The branch fetch rides along in the same statement: the subquery
+# picks the next issue and the LEFT JOIN expands its branches, so the
+# common one-issue-per-call path costs a single execute
+_SQL_NEXT_ISSUE_WITH_BRANCHES = """
+    SELECT
+        ci.id, ci.file_path, ci.source_file_id, ci.line_number,
+        ci.is_excluded, ci.created_at,
+        cb.id AS branch_id, cb.source_line, cb.end_line,
+        cb.condition, cb.branch_type, cb.created_at AS branch_created_at
+    FROM coverage_issues ci
+    LEFT JOIN coverage_branches cb ON cb.coverage_issue_id = ci.id
+    WHERE ci.id = (
+        SELECT id FROM coverage_issues
+        WHERE (? IS NULL OR file_path = ?)
+        ORDER BY id LIMIT 1
+    )
+"""
+
 
 def save_test_results_to_db(
     test_file_path: str,
@@ -47,64 +177,79 @@ def save_test_results_to_db(
     """
     repo_logger.info(f"Saving test results to database for {test_file_path}")
 
-    with get_cursor() as cursor:
-        # Get or create the PyTestFile record
+    # Serialize the summary and format the timestamp once; both were
+    # previously recomputed per statement (and per error row) on the
+    # hot write path
+    now = format_datetime()
+    summary_blob = json_dumps(summary_data)
+
+    # One explicit transaction for the whole save: the file upsert, the
+    # delete, and every error insert share a single commit fsync
+    with transaction() as cursor:
+        # Upsert the PyTestFile record and read back its id in one
+        # statement
         cursor.execute(
-            "SELECT id FROM pytest_files WHERE file_path = ?", (test_file_path,)
-        )
-        result = cursor.fetchone()
-
-        if result:
-            # If found, get the ID
-            test_file_id = result["id"]
-            repo_logger.info(f"Found existing PyTestFile record with ID {test_file_id}")
-        else:
-            # If not found, insert a new record
-            repo_logger.info(f"Creating new PyTestFile record for {test_file_path}")
-            current_time = format_datetime()
-
-            cursor.execute(
-                """
-                INSERT INTO pytest_files 
-                (file_path, pytest_summary, created_at, updated_at) 
-                VALUES (?, ?, ?, ?)
-                """,
-                (test_file_path, json.dumps(summary_data), current_time, current_time),
-            )
-            test_file_id = cursor.lastrowid
-
-        # Update the summary data
-        cursor.execute(
-            "UPDATE pytest_files SET pytest_summary = ?, updated_at = ? WHERE id = ?",
-            (json.dumps(summary_data), format_datetime(), test_file_id),
+            _SQL_UPSERT_PYTEST_FILE,
+            (test_file_path, summary_blob, now, now),
         )
+        test_file_id = cursor.fetchone()["id"]
+        repo_logger.info(f"Upserted PyTestFile record with ID {test_file_id}")
 
         # Clear existing errors for this test file
-        cursor.execute(
-            "DELETE FROM pytest_errors WHERE test_file_id = ?", (test_file_id,)
-        )
+        cursor.execute(_SQL_DELETE_ERRORS_BY_TEST_FILE_ID, (test_file_id,))
 
-        # Insert new test errors
-        for error in test_errors:
-            cursor.execute(
-                """
-                INSERT INTO pytest_errors 
-                (node_id, test_file_id, outcome, error_type, result, longrepr, created_at) 
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+        # Insert new test errors in one batch: executemany binds every
+        # row against a single compiled statement instead of re-parsing
+        # the INSERT per error
+        if test_errors:
+            rows = [
                 (
                     error.get("node_id", ""),
                     test_file_id,
                     error.get("outcome", "failed"),
                     ERROR_TYPE_TEST,
-                    json.dumps(error.get("result", [])),
+                    json_dumps(error.get("result", [])),
                     error.get("longrepr", ""),
-                    format_datetime(),
-                ),
-            )
+                    now,
+                )
+                for error in test_errors
+            ]
+            cursor.executemany(_SQL_INSERT_PYTEST_ERROR, rows)
 
         repo_logger.info(f"Test results saved for {test_file_path}")
 
+    # The crud path caches read through the same table; clear them now
+    # that the upsert is committed
+    _invalidate_pytest_file_caches()
+
+
+def _insert_issue_batch(
+    cursor: sqlite3.Cursor,
+    rows: List[Tuple],
+    source_file_id: int,
+) -> List[int]:
+    """
+    Insert a batch of coverage-issue rows and return their generated ids.
+
+    sqlite3's executemany cannot carry a RETURNING clause, so the ids
+    are recovered with one SELECT over the newest len(rows) rows for the
+    file — valid because the enclosing save transaction just inserted
+    them last.
+
+    Args:
+        cursor: Cursor from the enclosing transaction
+        rows: Parameter tuples for _SQL_INSERT_COVERAGE_ISSUE
+        source_file_id: ID of the source file the rows belong to
+
+    Returns:
+        List[int]: Generated ids in the same order as rows
+    """
+    cursor.executemany(_SQL_INSERT_COVERAGE_ISSUE, rows)
+    cursor.execute(_SQL_GET_LAST_ISSUE_IDS, (source_file_id, len(rows)))
+    ids = [row["id"] for row in cursor.fetchall()]
+    ids.reverse()
+    return ids
+
 
 def save_coverage_issues_to_db(
     source_file_path: str,
@@ -119,122 +264,125 @@ def save_coverage_issues_to_db(
     """
     repo_logger.info(f"Saving coverage issues to database for {source_file_path}")
 
-    with get_cursor() as cursor:
-        # Get or create the SourceFile record
+    # Format the timestamp once for every row written by this save;
+    # per-row format_datetime calls were pure allocation overhead
+    now = format_datetime()
+
+    # One explicit transaction for the whole save, so the delete and
+    # every issue/branch insert share a single commit fsync
+    with transaction() as cursor:
+        # Upsert the SourceFile record and read back its id in one
+        # statement; an existing row keeps its hash and only gets touched
         cursor.execute(
-            "SELECT id FROM source_files WHERE file_path = ?", (source_file_path,)
+            _SQL_UPSERT_SOURCE_FILE,
+            (source_file_path, "", now, now),
         )
-        result = cursor.fetchone()
-
-        if result:
-            source_file_id = result["id"]
-            repo_logger.info(
-                f"Found existing SourceFile record with ID {source_file_id}"
-            )
-        else:
-            repo_logger.info(f"Creating new SourceFile record for {source_file_path}")
-            current_time = format_datetime()
-
-            cursor.execute(
-                """
-                INSERT INTO source_files 
-                (file_path, file_hash, created_at, updated_at) 
-                VALUES (?, ?, ?, ?)
-                """,
-                (source_file_path, "", current_time, current_time),
-            )
-            source_file_id = cursor.lastrowid
-
-        # Group issues by type
-        line_issues = [
-            issue
-            for issue in coverage_issues
-            if issue.get("type", "") == "CoverageIssue"
-        ]
-        branch_issues = [
-            issue
-            for issue in coverage_issues
-            if issue.get("type", "") == "CoverageBranch"
-        ]
+        source_file_id = cursor.fetchone()["id"]
+        repo_logger.info(f"Upserted SourceFile record with ID {source_file_id}")
+
+        # Partition issues by type in one pass instead of scanning the
+        # full list twice with separate comprehension filters
+        line_issues: List[CoverageIssueDict] = []
+        branch_issues: List[CoverageBranchDict] = []
+        appenders = {
+            "CoverageIssue": line_issues.append,
+            "CoverageBranch": branch_issues.append,
+        }
+        for issue in coverage_issues:
+            append = appenders.get(issue.get("type", ""))
+            if append is not None:
+                append(issue)
 
         # Clear existing issues for this source file
-        cursor.execute(
-            "DELETE FROM coverage_issues WHERE file_path = ?", (source_file_path,)
-        )
+        cursor.execute(_SQL_DELETE_ISSUES_BY_FILE_PATH, (source_file_path,))
         # Cascade will delete related branches due to foreign key constraint
 
-        # Add new line issues
-        for issue in line_issues:
-            cursor.execute(
-                """
-                INSERT INTO coverage_issues 
-                (file_path, source_file_id, line_number, is_excluded, created_at) 
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    source_file_path,
-                    source_file_id,
-                    issue.get("line_number", 0),
-                    bool(issue.get("is_excluded", False)),
-                    format_datetime(),
-                ),
+        # Line issues without branches need no generated id back; issues
+        # with branches are batched too, recovering their ids afterwards
+        # with one SELECT instead of a lastrowid read per row
+        simple_issues = [issue for issue in line_issues if not issue.get("branches")]
+        branched_issues = [issue for issue in line_issues if issue.get("branches")]
+
+        if simple_issues:
+            cursor.executemany(
+                _SQL_INSERT_COVERAGE_ISSUE,
+                [
+                    (
+                        source_file_path,
+                        source_file_id,
+                        issue.get("line_number", 0),
+                        bool(issue.get("is_excluded", False)),
+                        now,
+                    )
+                    for issue in simple_issues
+                ],
             )
-            coverage_issue_id = cursor.lastrowid
-
-            # If this is also a branch issue, add corresponding branches
-            if "branches" in issue and issue["branches"]:
-                for branch in issue["branches"]:
-                    cursor.execute(
-                        """
-                        INSERT INTO coverage_branches 
-                        (coverage_issue_id, source_line, end_line, condition, branch_type, created_at) 
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            coverage_issue_id,
-                            branch.get("source_line", 0),
-                            branch.get("end_line", 0),
-                            branch.get("condition", ""),
-                            branch.get("branch_type", ""),
-                            format_datetime(),
-                        ),
+
+        if branched_issues:
+            parent_ids = _insert_issue_batch(
+                cursor,
+                [
+                    (
+                        source_file_path,
+                        source_file_id,
+                        issue.get("line_number", 0),
+                        bool(issue.get("is_excluded", False)),
+                        now,
                     )
+                    for issue in branched_issues
+                ],
+                source_file_id,
+            )
+            cursor.executemany(
+                _SQL_INSERT_COVERAGE_BRANCH,
+                [
+                    (
+                        issue_id,
+                        branch.get("source_line", 0),
+                        branch.get("end_line", 0),
+                        branch.get("condition", ""),
+                        branch.get("branch_type", ""),
+                        now,
+                    )
+                    for issue_id, issue in zip(parent_ids, branched_issues)
+                    for branch in issue["branches"]
+                ],
+            )
 
-        # Add branch issues that weren't part of line issues
-        for branch in branch_issues:
-            # Only process standalone branches (not already handled through line issues)
-            if "parent_issue_id" not in branch:
-                cursor.execute(
-                    """
-                    INSERT INTO coverage_issues 
-                    (file_path, source_file_id, line_number, is_excluded, created_at) 
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
+        # Add branch issues that weren't part of line issues; only
+        # standalone branches (not already handled through line issues)
+        standalone_branches = [
+            branch for branch in branch_issues if "parent_issue_id" not in branch
+        ]
+        if standalone_branches:
+            parent_ids = _insert_issue_batch(
+                cursor,
+                [
                     (
                         source_file_path,
                         source_file_id,
                         branch.get("source_line", 0),
                         False,  # Standalone branches aren't excluded
-                        format_datetime(),
-                    ),
-                )
-                coverage_issue_id = cursor.lastrowid
-
-                cursor.execute(
-                    """
-                    INSERT INTO coverage_branches 
-                    (coverage_issue_id, source_line, end_line, condition, branch_type, created_at) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
+                        now,
+                    )
+                    for branch in standalone_branches
+                ],
+                source_file_id,
+            )
+            cursor.executemany(
+                _SQL_INSERT_COVERAGE_BRANCH,
+                [
                     (
-                        coverage_issue_id,
+                        issue_id,
                         branch.get("source_line", 0),
                         branch.get("end_line", 0),
                         branch.get("condition", ""),
                         branch.get("branch_type", ""),
-                        format_datetime(),
-                    ),
-                )
+                        now,
+                    )
+                    for issue_id, branch in zip(parent_ids, standalone_branches)
+                ],
+            )
 
         # Log the results
         repo_logger.info(
@@ -242,6 +390,10 @@ def save_coverage_issues_to_db(
             f"{len(line_issues)} line issues, {len(branch_issues)} branch issues"
         )
 
+    # The crud path caches read through the same table; clear them now
+    # that the upsert is committed
+    _invalidate_source_file_caches()
+
 
 def get_pytest_file(file_path: str) -> Optional[PyTestFileDict]:
     """
@@ -255,17 +407,8 @@ def get_pytest_file(file_path: str) -> Optional[PyTestFileDict]:
     """
     repo_logger.debug(f"Getting PyTestFile for {file_path}")
 
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT 
-                pf.id, pf.file_path, pf.source_file_id, pf.pytest_summary, 
-                pf.created_at, pf.updated_at 
-            FROM pytest_files pf
-            WHERE pf.file_path = ?
-            """,
-            (file_path,),
-        )
+    with read_cursor() as cursor:
+        cursor.execute(_SQL_GET_PYTEST_FILE_BY_PATH, (file_path,))
         result = cursor.fetchone()
 
         if not result:
@@ -275,22 +418,14 @@ def get_pytest_file(file_path: str) -> Optional[PyTestFileDict]:
         # Convert row to dictionary
         test_file = dict(result)
 
-        # Get related errors
-        cursor.execute(
-            """
-            SELECT * FROM pytest_errors 
-            WHERE test_file_id = ?
-            """,
-            (test_file["id"],),
-        )
-        test_errors = [dict(row) for row in cursor.fetchall()]
-
-        # Add errors to test file dictionary
-        test_file["test_errors"] = test_errors
+        # Get related errors; the C-implemented Rows support name access
+        # directly, so there is no need to copy each into a dict
+        cursor.execute(_SQL_GET_ERRORS_BY_TEST_FILE_ID, (test_file["id"],))
+        test_file["test_errors"] = cursor.fetchall()
 
         # Parse JSON fields
         if test_file["pytest_summary"]:
-            test_file["pytest_summary"] = json.loads(test_file["pytest_summary"])
+            test_file["pytest_summary"] = json_loads(test_file["pytest_summary"])
 
         return test_file
 
@@ -307,16 +442,8 @@ def get_source_file(file_path: str) -> Optional[SourceFileDict]:
     """
     repo_logger.debug(f"Getting SourceFile for {file_path}")
 
-    with get_cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT 
-                sf.id, sf.file_path, sf.file_hash, sf.created_at, sf.updated_at 
-            FROM source_files sf
-            WHERE sf.file_path = ?
-            """,
-            (file_path,),
-        )
+    with read_cursor() as cursor:
+        cursor.execute(_SQL_GET_SOURCE_FILE_BY_PATH, (file_path,))
         result = cursor.fetchone()
 
         if not result:
@@ -326,30 +453,38 @@ def get_source_file(file_path: str) -> Optional[SourceFileDict]:
         # Convert row to dictionary
         source_file = dict(result)
 
-        # Get related coverage issues
-        cursor.execute(
-            """
-            SELECT * FROM coverage_issues 
-            WHERE source_file_id = ?
-            """,
-            (source_file["id"],),
-        )
+        # Fetch issues and their branches in one statement and regroup
+        # in a single pass over the ORDER BY ci.id rows
+        cursor.execute(_SQL_GET_ISSUES_WITH_BRANCHES, (source_file["id"],))
         coverage_issues = []
-
-        for issue_row in cursor.fetchall():
-            issue = dict(issue_row)
-
-            # Get related branches for this issue
-            cursor.execute(
-                """
-                SELECT * FROM coverage_branches 
-                WHERE coverage_issue_id = ?
-                """,
-                (issue["id"],),
-            )
-            branches = [dict(branch_row) for branch_row in cursor.fetchall()]
-            issue["branches"] = branches
-            coverage_issues.append(issue)
+        issue = None
+
+        for row in cursor.fetchall():
+            if issue is None or issue["id"] != row["id"]:
+                issue = {
+                    "id": row["id"],
+                    "file_path": row["file_path"],
+                    "source_file_id": row["source_file_id"],
+                    "line_number": row["line_number"],
+                    "is_excluded": row["is_excluded"],
+                    "created_at": row["created_at"],
+                    "branches": [],
+                }
+                coverage_issues.append(issue)
+
+            # LEFT JOIN pads issues without branches with NULL branch ids
+            if row["branch_id"] is not None:
+                issue["branches"].append(
+                    {
+                        "id": row["branch_id"],
+                        "coverage_issue_id": row["id"],
+                        "source_line": row["source_line"],
+                        "end_line": row["end_line"],
+                        "condition": row["condition"],
+                        "branch_type": row["branch_type"],
+                        "created_at": row["branch_created_at"],
+                    }
+                )
 
         # Add coverage issues to source file dictionary
         source_file["coverage_issues"] = coverage_issues
@@ -375,63 +510,86 @@ def get_next_pytest_error(
             f"Test file details - id: {test_file['id']}, path: {test_file['file_path']}"
         )
 
-    with get_cursor() as cursor:
+    with read_cursor() as cursor:
         test_file_id = test_file["id"]
 
         # Check for test errors
-        cursor.execute(
-            """
-            SELECT * FROM pytest_errors 
-            WHERE test_file_id = ? 
-            ORDER BY id LIMIT 1
-            """,
-            (test_file_id,),
-        )
+        cursor.execute(_SQL_NEXT_ERROR_FOR_TEST_FILE, (test_file_id,))
         result = cursor.fetchone()
 
         if result:
-            # Convert row to dictionary
-            error = dict(result)
             repo_logger.info(
-                f"Found test error: id={error['id']}, node_id={error['node_id']}"
+                f"Found test error: id={result['id']}, node_id={result['node_id']}"
             )
 
-            # Parse JSON fields
-            if error.get("result"):
-                error["result"] = json.loads(error["result"])
+            # Materialize a dict only when a JSON payload needs parsing;
+            # otherwise the Row is returned as-is (it supports both
+            # index and name access)
+            if result["result"]:
+                error = dict(result)
+                error["result"] = json_loads(error["result"])
+                return error
 
-            return error
+            return result
         else:
             repo_logger.info("No test errors found")
 
         return None
 
 
-def delete_pytest_error(node_id: str) -> int:
+def delete_pytest_errors(node_ids: Sequence[str]) -> int:
     """
-    Delete all PyTestErrors from the database matching the given node ID.
+    Delete all PyTestErrors matching any of the given node IDs.
+
+    Callers iterating a run's failed tests previously paid one DELETE
+    and commit per node ID; a chunked IN (...) clears the whole batch
+    with one statement per 500 ids under a single commit.
 
     Args:
-        node_id: The node ID of the PyTestError(s) to delete
+        node_ids: Node IDs of the PyTestErrors to delete
 
     Returns:
         int: The number of errors deleted
     """
-    repo_logger.debug(f"Deleting pytest errors with node ID: {node_id}")
+    if not node_ids:
+        return 0
+
+    node_ids = list(node_ids)
+    repo_logger.debug(f"Deleting pytest errors for {len(node_ids)} node IDs")
     count = 0
 
     with get_cursor() as cursor:
-        # Find and delete regular test errors (using node_id)
-        cursor.execute("DELETE FROM pytest_errors WHERE node_id = ?", (node_id,))
-        count += cursor.rowcount
+        for start in range(0, len(node_ids), _IN_CHUNK):
+            chunk = node_ids[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"DELETE FROM pytest_errors WHERE node_id IN ({placeholders})",
+                chunk,
+            )
+            count += cursor.rowcount
+
+    if count == 0:
+        repo_logger.debug("No pytest errors found for the given node IDs")
+    else:
+        repo_logger.info(f"Deleted {count} pytest errors")
+    return count
 
-        if count == 0:
-            repo_logger.debug(f"No pytest errors found with node ID: {node_id}")
-            return 0
 
-        cursor.connection.commit()
-        repo_logger.info(f"Deleted {count} pytest errors with node ID: {node_id}")
-        return count
+def delete_pytest_error(node_id: str) -> int:
+    """
+    Delete all PyTestErrors from the database matching the given node ID.
+
+    Single-id wrapper kept for existing callers; batch deletions should
+    go through delete_pytest_errors.
+
+    Args:
+        node_id: The node ID of the PyTestError(s) to delete
+
+    Returns:
+        int: The number of errors deleted
+    """
+    repo_logger.debug(f"Deleting pytest errors with node ID: {node_id}")
+    return delete_pytest_errors((node_id,))
 
 
 def get_next_coverage_issue(
@@ -448,47 +606,41 @@ def get_next_coverage_issue(
     """
     repo_logger.debug(f"Getting next coverage issue for file: {file_path}")
 
-    with get_cursor() as cursor:
+    with read_cursor() as cursor:
         try:
-            # Build the query
-            query = """
-                SELECT * FROM coverage_issues 
-                ORDER BY id LIMIT 1
-            """
-            params = ()
-
-            # Add filter for file_path if provided
-            if file_path:
-                query = """
-                    SELECT * FROM coverage_issues 
-                    WHERE file_path = ? 
-                    ORDER BY id LIMIT 1
-                """
-                params = (file_path,)
-
-            # Execute the query
-            cursor.execute(query, params)
-            result = cursor.fetchone()
+            # One statement covers both call shapes; a NULL bind skips
+            # the file filter, and the branches arrive in the same rows
+            file_path = file_path or None
+            cursor.execute(_SQL_NEXT_ISSUE_WITH_BRANCHES, (file_path, file_path))
+            rows = cursor.fetchall()
 
             # If we found a coverage issue
-            if result:
-                # Convert row to dictionary
-                issue = dict(result)
+            if rows:
+                first = rows[0]
+                issue = {
+                    "id": first["id"],
+                    "file_path": first["file_path"],
+                    "source_file_id": first["source_file_id"],
+                    "line_number": first["line_number"],
+                    "is_excluded": first["is_excluded"],
+                    "created_at": first["created_at"],
+                    "branches": [
+                        {
+                            "id": row["branch_id"],
+                            "coverage_issue_id": row["id"],
+                            "source_line": row["source_line"],
+                            "end_line": row["end_line"],
+                            "condition": row["condition"],
+                            "branch_type": row["branch_type"],
+                            "created_at": row["branch_created_at"],
+                        }
+                        for row in rows
+                        if row["branch_id"] is not None
+                    ],
+                }
                 repo_logger.info(
                     f"Found coverage issue: id={issue['id']}, file={issue['file_path']}, line={issue['line_number']}"
                 )
-
-                # Get branches for this issue
-                cursor.execute(
-                    """
-                    SELECT * FROM coverage_branches 
-                    WHERE coverage_issue_id = ?
-                    """,
-                    (issue["id"],),
-                )
-                branches = [dict(row) for row in cursor.fetchall()]
-                issue["branches"] = branches
-
                 return issue
 
             # No coverage issues found
@@ -517,26 +669,11 @@ def get_next_pytest_error_dict(test_file: Optional[PyTestFileDict] = None) -> di
     """
     repo_logger.info(f"get_next_pytest_error_dict called with test_file: {test_file}")
 
-    with get_cursor() as cursor:
-        # Build the base query
-        test_query = """
-            SELECT * FROM pytest_errors 
-            ORDER BY id LIMIT 1
-        """
-
-        # Add filter if test_file is provided
-        params = ()
-        if test_file:
-            test_file_id = test_file["id"]
-            test_query = """
-                SELECT * FROM pytest_errors 
-                WHERE test_file_id = ? 
-                ORDER BY id LIMIT 1
-            """
-            params = (test_file_id,)
-
-        # Execute the query
-        cursor.execute(test_query, params)
+    with read_cursor() as cursor:
+        # One statement covers both call shapes; a NULL bind skips the
+        # test-file filter
+        test_file_id = test_file["id"] if test_file else None
+        cursor.execute(_SQL_NEXT_ERROR, (test_file_id, test_file_id))
         result = cursor.fetchone()
 
         if result:
@@ -549,8 +686,8 @@ def get_next_pytest_error_dict(test_file: Optional[PyTestFileDict] = None) -> di
             # Parse JSON fields if present
             if error.get("result"):
                 try:
-                    error["result"] = json.loads(error["result"])
-                except json.JSONDecodeError:
+                    error["result"] = json_loads(error["result"])
+                except ValueError:
                     error["result"] = []
 
             # Add error type
@@ -576,36 +713,22 @@ def save_source_file_to_db(source_path: str) -> Optional[int]:
 
     try:
         with get_cursor() as cursor:
-            # Check if the source file is already in the database
+            # Insert or touch the record and read back its id in one
+            # statement
+            current_time = format_datetime()
             cursor.execute(
-                "SELECT id FROM source_files WHERE file_path = ?", (source_path,)
+                _SQL_UPSERT_SOURCE_FILE,
+                (source_path, "", current_time, current_time),
             )
-            result = cursor.fetchone()
-
-            # If not, create a new source file record
-            if not result:
-                repo_logger.debug("Creating source file record: %s", source_path)
-                current_time = format_datetime()
-
-                cursor.execute(
-                    """
-                    INSERT INTO source_files 
-                    (file_path, file_hash, created_at, updated_at) 
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (source_path, "", current_time, current_time),
-                )
-                source_file_id = cursor.lastrowid
-                repo_logger.info(
-                    "Source file saved to database with ID: %s", source_file_id
-                )
-                return source_file_id
-            else:
-                source_file_id = result["id"]
-                repo_logger.info(
-                    "Source file already exists in database with ID: %s", source_file_id
-                )
-                return source_file_id
+            source_file_id = cursor.fetchone()["id"]
+            repo_logger.info(
+                "Source file saved to database with ID: %s", source_file_id
+            )
+
+        # Invalidate after get_cursor's commit so the crud path caches
+        # cannot re-cache the pre-upsert state in between
+        _invalidate_source_file_caches()
+        return source_file_id
 
     except Exception as e:
         repo_logger.error("Error saving source file to database: %s", e)
@@ -635,36 +758,23 @@ def save_test_file_to_db(test_path: str, source_path: str) -> Optional[int]:
             repo_logger.warning("Could not get source file ID for %s", source_path)
 
         with get_cursor() as cursor:
-            # Check if the test file is already in the database
+            # Insert or refresh the association and read back the id in
+            # one statement; COALESCE keeps an existing source link when
+            # the source save failed
+            current_time = format_datetime()
             cursor.execute(
-                "SELECT id FROM pytest_files WHERE file_path = ?", (test_path,)
+                _SQL_UPSERT_TEST_FILE,
+                (test_path, source_file_id, "{}", current_time, current_time),
             )
-            result = cursor.fetchone()
-
-            # If not, create a new test file record
-            if not result:
-                repo_logger.debug("Creating test file record: %s", test_path)
-                current_time = format_datetime()
-
-                cursor.execute(
-                    """
-                    INSERT INTO pytest_files 
-                    (file_path, source_file_id, pytest_summary, created_at, updated_at) 
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (test_path, source_file_id, "{}", current_time, current_time),
-                )
-                test_file_id = cursor.lastrowid
-                repo_logger.info(
-                    "Test file saved to database with ID: %s", test_file_id
-                )
-                return test_file_id
-            else:
-                test_file_id = result["id"]
-                repo_logger.info(
-                    "Test file already exists in database with ID: %s", test_file_id
-                )
-                return test_file_id
+            test_file_id = cursor.fetchone()["id"]
+            repo_logger.info(
+                "Test file saved to database with ID: %s", test_file_id
+            )
+
+        # Invalidate after get_cursor's commit so the crud path caches
+        # cannot re-cache the pre-upsert state in between
+        _invalidate_pytest_file_caches()
+        return test_file_id
 
     except Exception as e:
         repo_logger.error("Error saving test file to database: %s", e)
@@ -35,6 +35,10 @@ def get_schema_statements() -> List[str]:
     """
     Get the SQL statements from the schema file.
 
+    Kept for introspection only: the naive split breaks on semicolons
+    inside trigger bodies or string literals, so execution goes through
+    execute_schema instead.
+
     Returns:
         List[str]: List of SQL statements
     """
@@ -46,15 +50,13 @@ def get_schema_statements() -> List[str]:
 
 def execute_schema(conn: sqlite3.Connection) -> None:
     """
-    Execute the schema statements on a database connection.
+    Execute the schema on a database connection.
+
+    executescript parses and runs the whole file in one C call, and
+    unlike the Python-side split it handles semicolons inside compound
+    statements and literals correctly.
 
     Args:
         conn: SQLite connection
     """
-    cursor = conn.cursor()
-    statements = get_schema_statements()
-
-    for statement in statements:
-        cursor.execute(statement)
-
-    conn.commit()
+    conn.executescript(load_schema())
@@ -14,7 +14,7 @@ CREATE TABLE IF NOT EXISTS pytest_files (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     file_path TEXT UNIQUE NOT NULL,
     source_file_id INTEGER,
-    pytest_summary TEXT DEFAULT '{}',
+    pytest_summary BLOB DEFAULT '{}',
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
     FOREIGN KEY (source_file_id) REFERENCES source_files (id)
@@ -27,7 +27,7 @@ CREATE TABLE IF NOT EXISTS pytest_errors (
     test_file_id INTEGER NOT NULL,
     outcome TEXT NOT NULL,
     error_type TEXT NOT NULL,
-    result TEXT DEFAULT '[]',
+    result BLOB DEFAULT '[]',
     longrepr TEXT DEFAULT '',
     created_at TEXT NOT NULL,
     FOREIGN KEY (test_file_id) REFERENCES pytest_files (id)
@@ -40,7 +40,7 @@ CREATE TABLE IF NOT EXISTS pytest_collection_errors (
     test_file_id INTEGER NOT NULL,
     outcome TEXT NOT NULL,
     error_type TEXT NOT NULL,
-    result TEXT DEFAULT '[]',
+    result BLOB DEFAULT '[]',
     longrepr TEXT DEFAULT '',
     created_at TEXT NOT NULL,
     FOREIGN KEY (test_file_id) REFERENCES pytest_files (id)
@@ -67,4 +67,21 @@ CREATE TABLE IF NOT EXISTS coverage_branches (
     branch_type TEXT NOT NULL,
     created_at TEXT NOT NULL,
     FOREIGN KEY (coverage_issue_id) REFERENCES coverage_issues (id) ON DELETE CASCADE
-); 
\ No newline at end of file
+);
+
+-- Indexes for the WHERE columns used by CRUD and repository lookups;
+-- without them the get/delete helpers scan the full table. Entries with
+-- equal keys sort by rowid, so the ORDER BY id LIMIT 1 next-row queries
+-- are served by these without an explicit id column.
+CREATE INDEX IF NOT EXISTS idx_cov_issues_file_path ON coverage_issues(file_path);
+CREATE INDEX IF NOT EXISTS idx_cov_issues_source_file_id ON coverage_issues(source_file_id);
+CREATE INDEX IF NOT EXISTS idx_cov_branches_issue_id ON coverage_branches(coverage_issue_id);
+CREATE INDEX IF NOT EXISTS idx_pyt_col_err_test_file_id ON pytest_collection_errors(test_file_id);
+CREATE INDEX IF NOT EXISTS idx_pyt_col_err_node_id ON pytest_collection_errors(node_id);
+CREATE INDEX IF NOT EXISTS idx_pytest_errors_node_id ON pytest_errors(node_id);
+CREATE INDEX IF NOT EXISTS idx_pytest_errors_test_file_id ON pytest_errors(test_file_id);
+CREATE INDEX IF NOT EXISTS idx_pytest_files_source_id ON pytest_files(source_file_id);
+
+-- file_path is declared UNIQUE on both file tables, which already
+-- builds the lookup index; these cover the ORDER BY created_at pages
+CREATE INDEX IF NOT EXISTS idx_pytest_errors_created_at ON pytest_errors(created_at DESC);
\ No newline at end of file
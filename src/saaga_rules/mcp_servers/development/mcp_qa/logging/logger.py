@@ -5,10 +5,14 @@ This module provides a simplified logger using PrettyJSONSink to write human-rea
 JSON logs to qa.log.
 """
 
+import asyncio
+import queue
 import sqlite3
 import sys
 import json
 import io
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import TextIO, List, Dict, Optional
@@ -18,12 +22,26 @@ from loguru import logger
 # Configure and remove default logger
 logger.remove()
 
+# Batching bounds for the background log writer: flush whichever comes
+# first, a full batch or the interval elapsing
+_LOG_BATCH_SIZE = 500
+_LOG_FLUSH_INTERVAL = 0.1
+
+# Drop-on-full bound so a stalled writer can never block the hot path
+_LOG_QUEUE_SIZE = 10000
+
 
 def setup_db_logging(db_path=".logs.sqlite3"):
-    # Create/connect to SQLite DB
-    conn = sqlite3.connect(db_path)
+    # Create/connect to SQLite DB; the background writer thread owns all
+    # statement execution, hence check_same_thread=False
+    conn = sqlite3.connect(db_path, check_same_thread=False)
     cursor = conn.cursor()
 
+    # WAL + NORMAL: log inserts happen constantly and must not pay a
+    # journal rewrite plus fsync per commit
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+
     # Create logs table if it doesn't exist
     cursor.execute(
         """
@@ -40,21 +58,57 @@ def setup_db_logging(db_path=".logs.sqlite3"):
     )
     conn.commit()
 
-    # Define a function that will process each log and insert it into the database
+    log_queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+
+    def writer():
+        # Drain the queue in bounded batches so N log records cost one
+        # executemany and one commit fsync instead of N of each
+        while True:
+            rows = [log_queue.get()]
+            deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+            while len(rows) < _LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            # A transient sqlite error (locked DB, full disk) must not
+            # kill the daemon thread — that would silently drop every
+            # later record once the queue fills. The batch is lost but
+            # the writer keeps draining.
+            try:
+                cursor.executemany(
+                    "INSERT INTO logs (timestamp, level, message, function, file, line) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+            except sqlite3.Error:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
+
+    threading.Thread(target=writer, daemon=True, name="log-db-writer").start()
+
+    # The sink only builds the row tuple and enqueues it; all database
+    # work happens on the writer thread
     def db_sink(message):
         record = message.record
-        cursor.execute(
-            "INSERT INTO logs (timestamp, level, message, function, file, line) VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                record["time"].isoformat(),
-                record["level"].name,
-                record["message"],
-                record["function"],
-                record["file"].path,
-                record["line"],
-            ),
+        row = (
+            record["time"].isoformat(),
+            record["level"].name,
+            record["message"],
+            record["function"],
+            record["file"].path,
+            record["line"],
         )
-        conn.commit()
+        try:
+            log_queue.put_nowait(row)
+        except queue.Full:
+            # Drop rather than block the caller behind a stalled writer
+            pass
 
     # Add the sink to logger
     logger.add(db_sink, level="INFO")
@@ -62,6 +116,32 @@ def setup_db_logging(db_path=".logs.sqlite3"):
     return conn
 
 
+# Reader connection cached per database path: re-opening per call paid
+# the connect syscalls and threw away the page cache between queries
+_read_connections: Dict[str, sqlite3.Connection] = {}
+_read_connections_lock = threading.Lock()
+
+
+def _get_log_read_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Get or create the cached reader connection for a log database.
+
+    Args:
+        db_path: Path to the log database
+
+    Returns:
+        SQLite connection with row_factory set to sqlite3.Row
+    """
+    with _read_connections_lock:
+        conn = _read_connections.get(db_path)
+        if conn is None:
+            # Queries run on worker threads via asyncio.to_thread
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            _read_connections[db_path] = conn
+        return conn
+
+
 async def read_logs(
     n: int = 15, db_path: str = ".logs.sqlite3", level: str = "INFO"
 ) -> List[Dict]:
@@ -76,29 +156,25 @@ async def read_logs(
     Returns:
         List of log entries as dictionaries
     """
-    try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        query = "SELECT * FROM logs"
-        params = []
+    query = "SELECT * FROM logs"
+    params = []
 
-        if level:
-            query += " WHERE level = ?"
-            params.append(level)
+    if level:
+        query += " WHERE level = ?"
+        params.append(level)
 
-        query += " ORDER BY id DESC LIMIT ?"
-        params.append(n)
+    query += " ORDER BY id DESC LIMIT ?"
+    params.append(n)
 
+    def run_query() -> List[Dict]:
+        cursor = _get_log_read_connection(db_path).cursor()
         cursor.execute(query, params)
-        rows = cursor.fetchall()
+        return [dict(row) for row in cursor.fetchall()]
 
-        # Convert rows to dictionaries
-        logs = [dict(row) for row in rows]
-
-        conn.close()
-        return logs
+    try:
+        # The blocking execute/fetch runs on a worker thread so the
+        # event loop stays free
+        return await asyncio.to_thread(run_query)
     except Exception as e:
         logger.error(f"Error reading logs: {str(e)}")
         return []
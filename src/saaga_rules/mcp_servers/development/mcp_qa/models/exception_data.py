@@ -1,22 +1,34 @@
 import traceback
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TracebackEntry(BaseModel):
+    # Frozen models hash and compare through pydantic's C-backed
+    # field-tuple path instead of Python-level dunder overrides
+    model_config = ConfigDict(frozen=True)
+
     file_path: str
     lineno: int
     name: str
 
 
 class ExceptionData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     traceback: List[TracebackEntry]
     error_type: str
     error: str
 
     @classmethod
     def from_exception(cls, exc_type, exc_value, exc_traceback):
+        # lookup_lines=False skips reading each frame's source file;
+        # only filename/lineno/name are stored, so the line text that
+        # extract_tb eagerly loads would be discarded anyway
+        frames = traceback.StackSummary.extract(
+            traceback.walk_tb(exc_traceback), lookup_lines=False
+        )
         return cls(
             traceback=[
                 TracebackEntry(
@@ -24,16 +36,8 @@ class ExceptionData(BaseModel):
                     lineno=frame.lineno,
                     name=frame.name,
                 )
-                for frame in traceback.extract_tb(exc_traceback)
+                for frame in frames
             ],
             error_type=exc_type.__name__,
             error=str(exc_value),
         )
-
-    def __eq__(self, other):
-        if not isinstance(other, ExceptionData):
-            return False
-        return self.error_type == other.error_type and self.error == other.error
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
@@ -7,18 +7,21 @@ agent behavior through status codes and messages, facilitating handoffs between
 agents and tools in a workflow.
 """
 
-import json
-from enum import Enum
-from typing import Any, Callable, Optional
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, field_serializer
 
 
-class ToolStatus(str, Enum):
+class ToolStatus(StrEnum):
     """Enum representing possible tool execution statuses.
 
     These statuses can be used to control agent workflow and direct
     subsequent actions after tool execution.
+
+    StrEnum (3.11+) members are real strings, which pydantic-core
+    serializes without the extra coercion the str-mixin form needs.
     """
 
     SUCCESS = "Success"
@@ -28,71 +31,38 @@ class ToolStatus(str, Enum):
     EXCEPTION = "Exception"
 
 
-class NextAction(BaseModel):
+@dataclass(frozen=True, slots=True)
+class NextAction:
     """Represents a next action to be taken after a tool execution.
 
-    This model captures a function reference and optional instructions for the next
-    step in a workflow. During validation, it extracts the function name to set as
-    the mcp_tool field.
+    This captures a function reference and optional instructions for the next
+    step in a workflow. It only ever carries trusted in-process data, so a
+    frozen slotted dataclass replaces the previous BaseModel: construction is
+    an attribute write per field with no validator dispatch or metaclass
+    machinery.
 
     Attributes:
         tool: A callable function reference for the next action.
         instructions: Optional instructions for executing the next action.
-        mcp_tool: The name of the function, extracted during validation.
+        mcp_tool: The name of the function, derived from tool when unset.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     tool: Callable
     instructions: str = "Call the mcp tool."
-    mcp_tool: Optional[str] = None
-
-    @field_validator("tool")
-    def extract_tool_name(cls, v: Any, info: Any) -> Any:
-        """Extract the tool name and set it as mcp_tool."""
-        values = info.data
-        values["mcp_tool"] = v.__name__
-        return v
-
-    @model_validator(mode="after")
-    def ensure_mcp_tool(self) -> "NextAction":
-        """Ensure mcp_tool is set from the tool's name."""
-        if self.tool and not self.mcp_tool:
-            self.mcp_tool = self.tool.__name__
-        return self
-
-    def __str__(self) -> str:
-        """Override __str__ to run model_dump first and convert to string."""
-        return str(self.model_dump())
+    mcp_tool: str = ""
 
-    def model_dump(self, **kwargs):
-        """Override model_dump to exclude tool callable by default."""
-        exclude = kwargs.get("exclude", set())
-        if isinstance(exclude, set):
-            exclude.add("tool")
-        else:
-            exclude = {"tool"}
+    def __post_init__(self) -> None:
+        if not self.mcp_tool and self.tool is not None:
+            # Frozen dataclasses only allow writes via object.__setattr__
+            object.__setattr__(self, "mcp_tool", self.tool.__name__)
 
-        kwargs["exclude"] = exclude
+    def to_dict(self) -> dict:
+        """Return the serializable fields, excluding the tool callable."""
+        return {"instructions": self.instructions, "mcp_tool": self.mcp_tool}
 
-        # Get the result with exclude_none=False to include mcp_tool even if it's None
-        kwargs.setdefault("exclude_none", False)
-        result = super().model_dump(**kwargs)
-
-        # Ensure mcp_tool is always included
-        if "mcp_tool" not in result:
-            result["mcp_tool"] = self.mcp_tool
-
-        return result
-
-    def model_dump_json(self, **kwargs):
-        """Override model_dump_json to exclude None values by default and dump
-        next_action."""
-        kwargs.setdefault("exclude_none", True)
-        # Use model_dump to get the processed dict with next_action already handled
-        result = self.model_dump(**kwargs)
-        # Convert to JSON using BaseModel's json serialization
-        return json.dumps(result)
+    def __str__(self) -> str:
+        """Override __str__ to show the serializable fields."""
+        return str(self.to_dict())
 
 
 class ToolResult(BaseModel):
@@ -121,34 +91,34 @@ class ToolResult(BaseModel):
     message: str
     next_action: Optional[NextAction | dict] = None
 
+    @field_serializer("next_action", when_used="always")
+    def _serialize_next_action(self, v):
+        """Dump next_action inline during pydantic-core's single pass.
+
+        next_action keeps its None-valued fields (mcp_tool may be unset)
+        even though the enclosing dump excludes None at the top level.
+        """
+        if v is None or isinstance(v, dict):
+            return v
+        return v.to_dict()
+
     def __str__(self) -> str:
         """Override __str__ to handle next_action field."""
-        result = self.model_dump()
+        result = self.model_dump(exclude_none=True)
         return str(result)
 
-    def model_dump(self, **kwargs):
-        """Override model_dump to exclude None values by default and dump next_action."""
-        # For next_action, we want to include None values
-        next_action_exclude_none = False
+    def model_dump_json(self, **kwargs):
+        """Override model_dump_json to exclude None values by default.
 
-        # For everything else, use the provided exclude_none or default to True
+        The next_action handling lives in the field serializer, so one
+        pydantic-core pass replaces the old model_dump-then-json.dumps
+        pipeline.
+        """
         kwargs.setdefault("exclude_none", True)
-        result = super().model_dump(**kwargs)
-
-        # If next_action exists, replace it with its model_dump
-        if self.next_action is not None and result.get("next_action") is not None:
-            # Call model_dump with exclude_none=False for next_action
-            result["next_action"] = self.next_action.model_dump(
-                exclude_none=next_action_exclude_none
-            )
+        return super().model_dump_json(**kwargs)
 
-        return result
 
-    def model_dump_json(self, **kwargs):
-        """Override model_dump_json to exclude None values by default and dump
-        next_action."""
-        kwargs.setdefault("exclude_none", True)
-        # Use model_dump to get the processed dict with next_action already handled
-        result = self.model_dump(**kwargs)
-        # Convert to JSON using BaseModel's json serialization
-        return json.dumps(result)
+# Compile the pydantic-core schema at import instead of lazily on the
+# first validation, so the first tool response of the process does not
+# pay the schema-build cost
+ToolResult.model_rebuild(force=True)
@@ -11,6 +11,9 @@ Features:
 - Runs black to fix formatting and long lines
 """
 
+import asyncio
+from pathlib import Path
+
 from mcp_qa.config import logger
 from mcp_qa.models.tool_result import (
     NextAction,
@@ -21,8 +24,51 @@ from mcp_qa.tools.linter.flake8_report import flake8_report
 from mcp_qa.utils.git_utils import get_git_root
 
 from .lib.autoflake import run_autoflake
-from .lib.black import run_black
-from .lib.isort import run_isort
+from .lib.black import get_black_mode, run_black
+from .lib.isort import get_isort_config, run_isort
+
+try:
+    import autoflake
+    import black
+    import isort
+except ImportError:  # pragma: no cover - falls back to the per-tool runners
+    autoflake = black = isort = None
+
+# The follow-up action is constant for this tool, so it is built once at
+# import instead of on every formatter call
+_FLAKE8_NEXT_ACTION = NextAction(tool=flake8_report)
+
+
+def _format_file_in_memory(path: Path, max_line_length: int) -> bool:
+    """
+    Run the full formatting pipeline on a single file through memory.
+
+    The file is read once, passed through autoflake, isort and black as
+    in-memory strings, and written back only if anything changed —
+    instead of three tool runs each re-reading and rewriting it on disk.
+
+    Args:
+        path: Absolute path to the Python file to format
+        max_line_length: Maximum line length
+
+    Returns:
+        bool: True if the file was rewritten
+    """
+    src = path.read_text()
+    formatted = autoflake.fix_code(
+        src,
+        remove_all_unused_imports=True,
+        remove_unused_variables=True,
+        remove_duplicate_keys=True,
+        expand_star_imports=True,
+        ignore_init_module_imports=True,
+    )
+    formatted = isort.code(formatted, config=get_isort_config(max_line_length))
+    formatted = black.format_str(formatted, mode=get_black_mode(max_line_length))
+    if formatted != src:
+        path.write_text(formatted)
+        return True
+    return False
 
 
 async def formatter(file_path: str = "src/", max_line_length: int = 89):
@@ -43,30 +89,72 @@ async def formatter(file_path: str = "src/", max_line_length: int = 89):
     Returns:
         ToolResult: A ToolResult object containing formatting status and details
     """
+    # Brace-style args keep the message unformatted when the level is off
     logger.info(
-        f"Running formatters on {file_path} with " f"max_line_length={max_line_length}"
+        "Running formatters on {} with max_line_length={}",
+        file_path,
+        max_line_length,
     )
 
     # Find git root directory
     git_root = get_git_root()
-    logger.debug(f"Git root directory: {git_root}")
-
-    # Run autoflake to fix unused imports and variables
-    autoflake_result = run_autoflake(file_path, git_root)
-
-    # Run isort to fix import ordering
-    isort_result = run_isort(file_path, git_root, max_line_length)
-
-    # Run black to fix formatting and long lines
-    black_result = run_black(file_path, git_root, max_line_length)
-
-    # Check if all formatters completed successfully
-    all_success = all(
-        result.returncode == 0
-        for result in [autoflake_result, isort_result, black_result]
-    )
-
-    status = ToolStatus.SUCCESS if all_success else ToolStatus.FAILURE
+    logger.debug("Git root directory: {}", git_root)
+
+    target = git_root / file_path if file_path != "." else git_root
+    if autoflake is not None and target.is_file():
+        # Single-file fast path: one read, three in-memory passes, at
+        # most one write, instead of each tool round-tripping the file
+        # through the filesystem. A formatter error (e.g. black's
+        # InvalidInput on unparseable source) returns a FAILURE result,
+        # matching the directory branch.
+        try:
+            await asyncio.to_thread(_format_file_in_memory, target, max_line_length)
+        except Exception as e:
+            logger.error("Formatting failed for {}: {}", file_path, e)
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                message=f"Some formatters failed\nDetails: {e}",
+                next_action=_FLAKE8_NEXT_ACTION,
+            )
+        return ToolResult(
+            status=ToolStatus.SUCCESS,
+            message="Code formatting completed successfully",
+            next_action=_FLAKE8_NEXT_ACTION,
+        )
+    else:
+        # Run autoflake first: it rewrites the files the other two read,
+        # so it must finish before they start. The blocking subprocess
+        # call runs on a worker thread to keep the event loop free.
+        autoflake_result = await asyncio.to_thread(run_autoflake, file_path, git_root)
+
+        # isort and black also rewrite the same files in place (and both
+        # touch import lines), so they run sequentially for the same
+        # reason autoflake goes first — concurrent in-place writes would
+        # clobber each other. The worker thread still keeps the event
+        # loop free.
+        isort_result = await asyncio.to_thread(
+            run_isort, file_path, git_root, max_line_length
+        )
+        black_result = await asyncio.to_thread(
+            run_black, file_path, git_root, max_line_length
+        )
+
+        # Check if all formatters completed successfully; the explicit
+        # chain short-circuits without building a list and generator
+        all_success = (
+            autoflake_result.returncode == 0
+            and isort_result.returncode == 0
+            and black_result.returncode == 0
+        )
+
+    if all_success:
+        # The per-tool breakdown carries no information when everything
+        # completed, so the common path skips building it
+        return ToolResult(
+            status=ToolStatus.SUCCESS,
+            message="Code formatting completed successfully",
+            next_action=_FLAKE8_NEXT_ACTION,
+        )
 
     details = {
         "autoflake": "Completed" if autoflake_result.returncode == 0 else "Failed",
@@ -74,15 +162,8 @@ async def formatter(file_path: str = "src/", max_line_length: int = 89):
         "black": "Completed" if black_result.returncode == 0 else "Failed",
     }
 
-    message = (
-        "Code formatting completed successfully"
-        if all_success
-        else "Some formatters failed"
-    )
-    message += f"\nDetails: {details}"
-
     return ToolResult(
-        status=status,
-        message=message,
-        next_action=NextAction(tool=flake8_report),
+        status=ToolStatus.FAILURE,
+        message=f"Some formatters failed\nDetails: {details}",
+        next_action=_FLAKE8_NEXT_ACTION,
     )
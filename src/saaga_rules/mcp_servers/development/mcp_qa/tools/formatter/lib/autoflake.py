@@ -5,11 +5,58 @@ This module provides functionality for running autoflake to automatically fix
 common issues in Python code, such as removing unused imports and variables.
 """
 
+import io
 import subprocess
 from pathlib import Path
 
 from mcp_qa.logging.logger import logger
 
+try:
+    import autoflake
+except ImportError:  # pragma: no cover - falls back to the CLI
+    autoflake = None
+
+# The flag set never varies, so it is built once instead of per call
+_AUTOFLAKE_FLAGS = (
+    "--in-place",
+    "--recursive",
+    "--remove-all-unused-imports",
+    "--remove-unused-variables",
+    "--remove-duplicate-keys",
+    "--expand-star-imports",
+    "--ignore-init-module-imports",
+    "--quiet",
+)
+_AUTOFLAKE_BASE = ("uv", "run", "autoflake", *_AUTOFLAKE_FLAGS)
+
+
+def _run_autoflake_in_process(argv: list) -> subprocess.CompletedProcess:
+    """
+    Invoke autoflake's CLI entry point inside this process.
+
+    Skips the uv + interpreter + import cold start the subprocess path
+    pays on every call. autoflake's main takes explicit output streams,
+    so stdout/stderr are captured into buffers instead of leaking to the
+    server's own streams.
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        subprocess.CompletedProcess: Stub result mirroring the CLI call
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    returncode = autoflake.main(
+        ["autoflake", *argv], standard_out=stdout, standard_error=stderr
+    )
+    return subprocess.CompletedProcess(
+        ["autoflake", *argv],
+        returncode or 0,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
 
 def run_autoflake(file_path: str, git_root: Path) -> subprocess.CompletedProcess:
     """
@@ -27,31 +74,25 @@ def run_autoflake(file_path: str, git_root: Path) -> subprocess.CompletedProcess
     """
     logger.info(f"Running autoflake on {file_path} to fix issues automatically")
 
-    # Prepare the command
-    autoflake_cmd = [
-        "uv",
-        "run",
-        "autoflake",
-        "--in-place",
-        "--recursive",
-        "--remove-all-unused-imports",
-        "--remove-unused-variables",
-        "--remove-duplicate-keys",
-        "--expand-star-imports",
-        "--ignore-init-module-imports",
-        "--quiet",
-    ]
-
-    # Add the target file or directory for autoflake
-    if file_path != ".":
-        autoflake_cmd.append(file_path)
+    if autoflake is not None:
+        # In-process call: the target is resolved against the git root
+        # instead of chdir-ing, which keeps the call thread-safe
+        target = git_root / file_path if file_path != "." else git_root
+        autoflake_result = _run_autoflake_in_process(
+            [*_AUTOFLAKE_FLAGS, str(target)]
+        )
     else:
-        autoflake_cmd.append(".")
+        # Prepare the command with the target file or directory appended
+        autoflake_cmd = [*_AUTOFLAKE_BASE, file_path if file_path != "." else "."]
 
-    logger.debug(f"Executing autoflake command: {' '.join(autoflake_cmd)}")
-    autoflake_result = subprocess.run(
-        autoflake_cmd, cwd=str(git_root), text=True, capture_output=True
-    )
+        # lazy=True defers the join until the DEBUG level is enabled
+        logger.opt(lazy=True).debug(
+            "Executing autoflake command: {cmd}",
+            cmd=lambda: " ".join(autoflake_cmd),
+        )
+        autoflake_result = subprocess.run(
+            autoflake_cmd, cwd=str(git_root), text=True, capture_output=True
+        )
     logger.debug(f"Autoflake exit code: {autoflake_result.returncode}")
 
     # Log stdout and stderr
@@ -5,11 +5,68 @@ This module provides functionality for running black to automatically format
 Python code according to PEP 8 style guidelines.
 """
 
+import functools
 import subprocess
 from pathlib import Path
 
 from mcp_qa.config import logger
 
+try:
+    import black
+except ImportError:  # pragma: no cover - falls back to the CLI
+    black = None
+
+# The command prefix never varies, so it is built once instead of per call
+_BLACK_BASE = ("uv", "run", "black")
+
+
+@functools.lru_cache(maxsize=8)
+def get_black_mode(line_length: int) -> "black.Mode":
+    """
+    Get a cached black Mode for a line length.
+
+    Mode construction runs black's target-version and feature inference;
+    line lengths only ever take a couple of distinct values per process,
+    so the instances are memoized.
+
+    Args:
+        line_length: Maximum line length
+
+    Returns:
+        black.Mode: Cached mode instance
+    """
+    return black.Mode(line_length=line_length)
+
+
+def _run_black_in_process(argv: list) -> subprocess.CompletedProcess:
+    """
+    Invoke black's CLI entry point inside this process.
+
+    Skips the uv + interpreter + import cold start the subprocess path
+    pays on every call. black's click main exits via SystemExit carrying
+    the same code the CLI process would return; --quiet is forced so the
+    per-file progress lines are suppressed.
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        subprocess.CompletedProcess: Stub result mirroring the CLI call
+    """
+    try:
+        black.main(["--quiet", *argv])
+        returncode = 0
+    except SystemExit as exc:
+        if exc.code is None:
+            returncode = 0
+        elif isinstance(exc.code, int):
+            returncode = exc.code
+        else:
+            returncode = 1
+    return subprocess.CompletedProcess(
+        ["black", *argv], returncode, stdout="", stderr=""
+    )
+
 
 def run_black(
     file_path: str, git_root: Path, max_line_length: int = 89
@@ -30,24 +87,29 @@ def run_black(
     """
     logger.info(f"Running black on {file_path} to fix formatting and long lines")
 
-    # Prepare the command
-    black_cmd = [
-        "uv",
-        "run",
-        "black",
-        f"--line-length={max_line_length}",
-    ]
-
-    # Add the target file or directory for black
-    if file_path != ".":
-        black_cmd.append(file_path)
+    if black is not None:
+        # In-process call: the target is resolved against the git root
+        # instead of chdir-ing, which keeps the call thread-safe
+        target = git_root / file_path if file_path != "." else git_root
+        black_result = _run_black_in_process(
+            [f"--line-length={max_line_length}", str(target)]
+        )
     else:
-        black_cmd.append(".")
+        # Prepare the command with the target file or directory appended
+        black_cmd = [
+            *_BLACK_BASE,
+            f"--line-length={max_line_length}",
+            file_path if file_path != "." else ".",
+        ]
 
-    logger.debug(f"Executing black command: {' '.join(black_cmd)}")
-    black_result = subprocess.run(
-        black_cmd, cwd=str(git_root), text=True, capture_output=True
-    )
+        # lazy=True defers the join until the DEBUG level is enabled
+        logger.opt(lazy=True).debug(
+            "Executing black command: {cmd}",
+            cmd=lambda: " ".join(black_cmd),
+        )
+        black_result = subprocess.run(
+            black_cmd, cwd=str(git_root), text=True, capture_output=True
+        )
     logger.debug(f"Black exit code: {black_result.returncode}")
 
     # Log stdout and stderr
@@ -5,11 +5,70 @@ This module provides functionality for running isort to automatically fix
 import ordering in Python code.
 """
 
+import functools
 import subprocess
 from pathlib import Path
 
 from mcp_qa.config import logger
 
+try:
+    import isort
+    from isort.main import main as _isort_main
+except ImportError:  # pragma: no cover - falls back to the CLI
+    isort = None
+    _isort_main = None
+
+# The command prefix never varies, so it is built once instead of per call
+_ISORT_BASE = ("uv", "run", "isort", "--profile", "black")
+
+
+@functools.lru_cache(maxsize=8)
+def get_isort_config(line_length: int) -> "isort.Config":
+    """
+    Get a cached isort Config for a line length.
+
+    Config resolves the black profile's settings on construction; line
+    lengths only ever take a couple of distinct values per process, so
+    the instances are memoized.
+
+    Args:
+        line_length: Maximum line length
+
+    Returns:
+        isort.Config: Cached config instance
+    """
+    return isort.Config(profile="black", line_length=line_length)
+
+
+def _run_isort_in_process(argv: list) -> subprocess.CompletedProcess:
+    """
+    Invoke isort's CLI entry point inside this process.
+
+    Skips the uv + interpreter + import cold start the subprocess path
+    pays on every call. --quiet is forced so the per-file "Fixing" lines
+    never reach the server's stdout; error exits surface as SystemExit
+    with the CLI's code.
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        subprocess.CompletedProcess: Stub result mirroring the CLI call
+    """
+    try:
+        _isort_main(["--quiet", *argv])
+        returncode = 0
+    except SystemExit as exc:
+        if exc.code is None:
+            returncode = 0
+        elif isinstance(exc.code, int):
+            returncode = exc.code
+        else:
+            returncode = 1
+    return subprocess.CompletedProcess(
+        ["isort", *argv], returncode, stdout="", stderr=""
+    )
+
 
 def run_isort(
     file_path: str, git_root: Path, max_line_length: int = 89
@@ -30,26 +89,34 @@ def run_isort(
     """
     logger.info(f"Running isort on {file_path} to fix import ordering")
 
-    # Prepare the command
-    isort_cmd = [
-        "uv",
-        "run",
-        "isort",
-        "--profile",
-        "black",
-        f"--line-length={max_line_length}",
-    ]
-
-    # Add the target file or directory for isort
-    if file_path != ".":
-        isort_cmd.append(file_path)
+    if _isort_main is not None:
+        # In-process call: the target is resolved against the git root
+        # instead of chdir-ing, which keeps the call thread-safe
+        target = git_root / file_path if file_path != "." else git_root
+        isort_result = _run_isort_in_process(
+            [
+                "--profile",
+                "black",
+                f"--line-length={max_line_length}",
+                str(target),
+            ]
+        )
     else:
-        isort_cmd.append(".")
+        # Prepare the command with the target file or directory appended
+        isort_cmd = [
+            *_ISORT_BASE,
+            f"--line-length={max_line_length}",
+            file_path if file_path != "." else ".",
+        ]
 
-    logger.debug(f"Executing isort command: {' '.join(isort_cmd)}")
-    isort_result = subprocess.run(
-        isort_cmd, cwd=str(git_root), text=True, capture_output=True
-    )
+        # lazy=True defers the join until the DEBUG level is enabled
+        logger.opt(lazy=True).debug(
+            "Executing isort command: {cmd}",
+            cmd=lambda: " ".join(isort_cmd),
+        )
+        isort_result = subprocess.run(
+            isort_cmd, cwd=str(git_root), text=True, capture_output=True
+        )
     logger.debug(f"Isort exit code: {isort_result.returncode}")
 
     # Log stdout and stderr
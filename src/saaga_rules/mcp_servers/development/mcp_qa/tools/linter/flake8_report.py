@@ -14,14 +14,11 @@ Features:
 - Generate flake8 reports for further analysis
 """
 
-import json
-
 from mcp_qa.config import logger
 from mcp_qa.models.tool_result import ToolResult, ToolStatus
 from mcp_qa.tools.linter.lib.flake8 import (
-    process_flake8_issues,
+    iter_flake8_issues,
     run_flake8_command,
-    set_output_file,
 )
 from mcp_qa.tools.linter.pylint_tool import pylint_report
 
@@ -62,12 +59,9 @@ async def flake8_report(
         #     logger.error(error_message)
         #     return ToolResult(status=ToolStatus.ERROR, message=error_message)
 
-        # Set the output file path
-        report_file_path = set_output_file(git_root)
-
-        # Run the flake8 command
-        success, error_message = run_flake8_command(
-            file_path, report_file_path, git_root, max_line_length, ignore
+        # Run the flake8 command; the JSON report comes back on stdout
+        success, error_message, payload = await run_flake8_command(
+            file_path, git_root, max_line_length, ignore
         )
 
         if not success:
@@ -76,11 +70,9 @@ async def flake8_report(
                 message=error_message,
             )
 
-        all_warnings = process_flake8_issues(report_file_path)
-
-        # Get the next flake8 issue to fix
-
-        first_error_message = next(iter(all_warnings))
+        # Get the next flake8 issue to fix; the lazy iterator stops at
+        # the first issue instead of materializing the whole report
+        first_error_message = next(iter_flake8_issues(payload))
         return ToolResult(
             status=ToolStatus.CONTINUE,
             message=f"Flake8 error found:\n{first_error_message}",
@@ -93,8 +85,10 @@ async def flake8_report(
             message="Flake8 'inting complete! No flake errors found.",
             success_message=call_tool(pylint_report),
         )
-    except json.JSONDecodeError as e:
-        error_msg = f"Error: Invalid JSON in {report_file_path}: {str(e)}"
+    except ValueError as e:
+        # ValueError covers the decode errors of both orjson and stdlib
+        # json, whichever iter_flake8_issues resolved to
+        error_msg = f"Error: Invalid JSON from flake8: {str(e)}"
         logger.error(error_msg)
         raise
 
@@ -1,14 +1,19 @@
 """Git utility functions for the pytest server."""
 
+import functools
 from pathlib import Path
 
 # Bind component to logger
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_root():
     """
     Find the git root directory by traversing up from the current file.
 
+    The result is memoized so repeated tool calls do not re-walk the
+    directory tree; use invalidate_git_root() to clear the cache.
+
     Returns:
         Path: The path to the git root directory.
 
@@ -34,3 +39,9 @@ def get_git_root():
         raise FileNotFoundError(error_msg)
 
     return git_root
+
+
+def invalidate_git_root():
+    """Clear the memoized git root (primarily for tests)."""
+
+    get_git_root.cache_clear()